@@ -7,6 +7,8 @@ It coordinates VM provisioning, service deployment, and configuration management
 """
 
 import argparse
+import asyncio
+import codecs
 import json
 import os
 import platform
@@ -33,6 +35,12 @@ from scripts.modules import (
     vm_metrics_collector
 )
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bytes read per call from a concurrent tenant run's output pipe
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class DeploymentMetrics:
     def __init__(self, tenant: str, enabled: bool, log_path: str | None = None):
@@ -346,7 +354,7 @@ def main(tenant_name: str, start_from_step: int = 1, *, metrics_enabled: bool =
             tenant_dir = constants.MS_CONFIG_DIR / "tenants" / tenant_name
             general_conf_path = tenant_dir / "general.conf.yml"
             with open(general_conf_path, 'r') as f:
-                general_config = yaml.safe_load(f) or {}
+                general_config = yaml.load(f, Loader=_YAML_LOADER) or {}
             vm_to_provision = (
                 general_config.get("deployment_target")
                 or general_config.get("vm_hostname")
@@ -358,7 +366,7 @@ def main(tenant_name: str, start_from_step: int = 1, *, metrics_enabled: bool =
         tenant_dir = constants.MS_CONFIG_DIR / "tenants" / tenant_name
         general_conf_path = tenant_dir / "general.conf.yml"
         with open(general_conf_path, 'r') as f:
-            general_config = yaml.safe_load(f) or {}
+            general_config = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         deployment_runtime_raw = str(general_config.get("deployment_runtime", "docker"))
         deployment_runtime = deployment_runtime_raw.lower()
@@ -470,13 +478,94 @@ def main(tenant_name: str, start_from_step: int = 1, *, metrics_enabled: bool =
         metrics.finish(error=error)
 
 
+async def _deploy_tenant_subprocess(
+    tenant_name: str,
+    forward_args: list[str],
+    semaphore: asyncio.Semaphore,
+) -> int:
+    """Run one tenant's orchestration as a child process, prefixing its output."""
+    async with semaphore:
+        utils.log_info(f"▶️  Starting tenant {tenant_name}")
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(Path(__file__).resolve()),
+            tenant_name,
+            *forward_args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        assert proc.stdout is not None
+        prefix = f"[{tenant_name}] "
+        write, flush = sys.stdout.write, sys.stdout.flush
+        # Fixed-size reads instead of line iteration: a child line longer
+        # than the StreamReader limit (e.g. `\r` progress bars) would raise
+        decode = codecs.getincrementaldecoder("utf-8")(errors="replace").decode
+        at_line_start = True
+        try:
+            while chunk := await proc.stdout.read(STREAM_CHUNK_SIZE):
+                for piece in decode(chunk).splitlines(keepends=True):
+                    if at_line_start:
+                        write(prefix)
+                    write(piece)
+                    at_line_start = piece.endswith("\n")
+                flush()
+            return await proc.wait()
+        finally:
+            # Cancelled or failed while the child still runs: don't leave it
+            # behind with nobody reading its output
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+
+async def deploy_many(
+    tenants: list[str],
+    concurrency: int = 4,
+    forward_args: list[str] | None = None,
+) -> dict[str, int]:
+    """
+    Deploy several tenants concurrently, at most `concurrency` at a time.
+
+    Each tenant runs as a separate orchestrator process: the per-tenant flow
+    relies on process-global state (SSH identity, debug flag), and the
+    provisioning/deploy scripts are long-running subprocesses anyway, so the
+    event loop only overlaps their network/SSH waits.
+
+    Args:
+        tenants: Tenant names to deploy (duplicates are deployed once)
+        concurrency: Maximum number of tenants deployed at once
+        forward_args: Extra CLI arguments passed to every tenant run
+
+    Returns:
+        Mapping of tenant name to its exit code
+    """
+    # Two orchestrators on the same tenant would race on its VM and state
+    tenants = list(dict.fromkeys(tenants))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks = [
+        asyncio.ensure_future(_deploy_tenant_subprocess(t, forward_args or [], semaphore))
+        for t in tenants
+    ]
+    try:
+        codes = await asyncio.gather(*tasks)
+    except BaseException:
+        # Cancelled or an internal error (a non-zero tenant exit doesn't
+        # raise): stop the others, each kills its own child
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return dict(zip(tenants, codes))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Full-stack orchestrator for Proxmox and Docker services."
     )
     parser.add_argument(
         "tenant",
-        help="The name of the tenant configuration to use (e.g., 'test')."
+        nargs="+",
+        help="The name of the tenant configuration to use (e.g., 'test'). Several tenants are deployed concurrently."
     )
     parser.add_argument(
         "--debug",
@@ -511,7 +600,14 @@ if __name__ == "__main__":
         default=None,
         help="Save the metrics log to a specific file path. If not set, a timestamped file is created in the tenant's metrics directory."
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of tenants deployed at once when several are given (default: 4)"
+    )
     args = parser.parse_args()
+    args.tenant = list(dict.fromkeys(args.tenant))
 
     # Set global DEBUG flag via context
     utils.DebugContext.set_debug(args.debug)
@@ -524,8 +620,30 @@ if __name__ == "__main__":
     env_metric = os.environ.get("METRIC", "")
     metrics_enabled = args.metrics or env_metric.lower() in {"1", "true", "yes", "on"}
 
+    if len(args.tenant) > 1:
+        forward_args = ["--start-from-step", str(args.start_from_step)]
+        if args.debug:
+            forward_args.append("--debug")
+        if args.no_chezmoi:
+            forward_args.append("--no-chezmoi")
+        if args.metrics:
+            forward_args.append("--metrics")
+        if args.skip_credentials:
+            forward_args.append("--skip-credentials")
+        if args.log_file:
+            utils.log_warn("⚠️ --log-file is ignored when deploying several tenants")
+
+        results = asyncio.run(deploy_many(args.tenant, args.concurrency, forward_args))
+        failed = [tenant for tenant, rc in results.items() if rc != 0]
+        for tenant, rc in results.items():
+            if rc == 0:
+                utils.log_success(f"Tenant {tenant} deployed")
+            else:
+                utils.log_error(f"Tenant {tenant} failed with exit code {rc}")
+        sys.exit(1 if failed else 0)
+
     main(
-        args.tenant,
+        args.tenant[0],
         start_from_step=args.start_from_step,
         metrics_enabled=metrics_enabled,
         skip_credentials=args.skip_credentials,
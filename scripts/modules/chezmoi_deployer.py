@@ -310,28 +310,25 @@ def verify_deployment(
     host_or_ip, _ = utils.get_vm_connection_info(vm_to_provision)
 
     try:
-        # Check if Chezmoi is installed
-        result = utils.ssh_command(
-            host_or_ip,
-            vm_username,
-            "chezmoi --version",
-            check=False
-        )
+        # All checks are read-only, so run them in one SSH session and
+        # evaluate the results in order
+        commands = ["chezmoi --version", "chezmoi managed"]
+        if deployment_runtime == "docker":
+            commands += [
+                "test -f ~/paas-deployment/docker-compose.yml",
+                "cd ~/paas-deployment && docker compose ps --format json",
+            ]
+        results = utils.ssh_command_many(host_or_ip, vm_username, commands, check=False)
 
-        if result.returncode != 0:
+        # Check if Chezmoi is installed
+        if results[0].returncode != 0:
             print("❌ Chezmoi not found on remote system")
             return False
 
         print("✅ Chezmoi is installed")
 
         # Check if configuration was applied
-        result = utils.ssh_command(
-            host_or_ip,
-            vm_username,
-            "chezmoi managed",
-            check=False
-        )
-
+        result = results[1]
         if result.returncode != 0:
             print("❌ Chezmoi configuration not applied")
             return False
@@ -342,28 +339,14 @@ def verify_deployment(
         # Runtime-specific verification
         if deployment_runtime == "docker":
             # Check if docker-compose.yml exists
-            result = utils.ssh_command(
-                host_or_ip,
-                vm_username,
-                "test -f ~/paas-deployment/docker-compose.yml",
-                check=False
-            )
-
-            if result.returncode != 0:
+            if results[2].returncode != 0:
                 print("❌ docker-compose.yml not found")
                 return False
 
             print("✅ docker-compose.yml deployed")
 
             # Check if Docker services are running
-            result = utils.ssh_command(
-                host_or_ip,
-                vm_username,
-                "cd ~/paas-deployment && docker compose ps --format json",
-                check=False
-            )
-
-            if result.returncode == 0:
+            if results[3].returncode == 0:
                 print("✅ Docker services verified")
             else:
                 print("⚠️ Could not verify Docker services")
@@ -18,6 +18,9 @@ from typing import Tuple, Dict, Any, Optional
 
 from . import constants
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def lint_configurations(tenant_name: str) -> str:
     """
@@ -54,7 +57,7 @@ def lint_configurations(tenant_name: str) -> str:
     general_config = {}
     if tenant_general.exists():
         with open(tenant_general, 'r') as f:
-            general_config = yaml.safe_load(f) or {}
+            general_config = yaml.load(f, Loader=_YAML_LOADER) or {}
     runtime = str(general_config.get("deployment_runtime", "docker")).lower()
     runtime_normalized = runtime.replace("_", "-")
 
@@ -80,11 +83,8 @@ def lint_configurations(tenant_name: str) -> str:
             print(f"  - {error}")
         sys.exit(1)
 
-    # Check for deployment target in tenant config
+    # Check for deployment target in tenant config (parsed above; the file exists by now)
     general_conf_path = required_paths["Tenant General Config"]
-    with open(general_conf_path, 'r') as f:
-        general_config = yaml.safe_load(f) or {}
-
     deployment_target = general_config.get("deployment_target")
     if not deployment_target:
         errors.append(f"Missing 'deployment_target' in {general_conf_path}. Cannot determine which VM to provision.")
@@ -132,13 +132,13 @@ def load_tenant_config(tenant_name: str) -> Tuple[Dict[str, Any], Dict[str, Any]
 
     if general_path.is_file():
         with open(general_path, 'r') as f:
-            general_config = yaml.safe_load(f) or {}
+            general_config = yaml.load(f, Loader=_YAML_LOADER) or {}
     else:
         print(f"⚠️ Warning: General config not found: {general_path}")
 
     if selection_path.is_file():
         with open(selection_path, 'r') as f:
-            selection_config = yaml.safe_load(f) or {}
+            selection_config = yaml.load(f, Loader=_YAML_LOADER) or {}
     else:
         print(f"⚠️ Warning: Selection config not found: {selection_path}")
 
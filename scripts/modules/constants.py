@@ -43,6 +43,7 @@ NIXOS_ANYWHERE_DEPLOY_TENANT_SCRIPT = NIXOS_ANYWHERE_DIR / "scripts" / "deploy-t
 
 # --- Staging Directory ---
 STAGED_ROOT_DIR = ROOT_DIR / ".staged"
+YAML_CACHE_DIR = STAGED_ROOT_DIR / "yaml-cache"  # parsed-YAML JSON sidecars
 
 # --- Chezmoi Configuration ---
 CHEZMOI_SOURCE_DIR = MS_CHEZMOI_DIR
@@ -75,13 +76,24 @@ CORE_DOCKER_PROFILES = ["traefik", "vaultwarden", "homepage", "tailscale", "post
 CORE_SERVICES_WAIT_TIME = 30  # seconds to wait after deploying core services
 
 # --- SSH/Connection Settings ---
+SSH_PORT = 22
 SSH_CONNECT_TIMEOUT = 5  # seconds
+SSH_SERVER_ALIVE_INTERVAL = 15  # seconds between keepalive probes on an open session
+SSH_SERVER_ALIVE_COUNT_MAX = 3  # unanswered keepalives before the session is dropped
 SSH_WAIT_TIMEOUT = 600  # seconds to wait for SSH to become available
 SSH_WAIT_INTERVAL = 10  # seconds between SSH connection attempts
+SSH_MAX_PARALLEL = 8  # concurrent SSH sessions per host (stays under sshd MaxStartups)
+SSH_CONTROL_DIR = Path.home() / ".ssh"
+SSH_CONTROL_PATH = "~/.ssh/cm-%C"  # %C hashes user/host/port, keeping socket paths short
+SSH_CONTROL_PERSIST = "600s"  # keep the shared master open between deploy phases (installs, reboots) after the last client exits
+# Bulk-transfer cipher preference: AES-GCM (AES-NI) first, aes128-ctr as the universally supported fallback
+SCP_CIPHERS = "aes128-gcm@openssh.com,aes256-gcm@openssh.com,chacha20-poly1305@openssh.com,aes128-ctr"
 
 # --- Environment Variables ---
 ENV_PROXMOX_API_TOKEN = "PROXMOX_VE_API_TOKEN"
 ENV_ORCH_DEBUG = "ORCH_DEBUG"
+ENV_REMOTE_PROBE_TTL = "PAAS_REMOTE_PROBE_TTL"  # seconds to cache remote capability probes; 0 disables
+ENV_SSH_MUX = "PAAS_SSH_MUX"  # set to 0 to disable SSH connection sharing (ControlMaster)
 
 # --- Service Port Mappings (for Traefik configuration) ---
 SERVICE_PORT_MAPPINGS = {
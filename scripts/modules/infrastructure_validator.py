@@ -5,30 +5,64 @@ Performs comprehensive pre-deployment validation of target infrastructure.
 Checks system resources, network connectivity, software dependencies, and security.
 """
 
+import asyncio
 import json
 import re
 import subprocess
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from . import constants, utils
 
 
+# Remote probe commands, shared by the checks and the async prefetch
+_CMD_SSH_PROBE = "echo 'connected'"
+_CMD_NPROC = "nproc"
+_CMD_FREE = "free -b"
+_CMD_DF = "df -B1 --output=avail /"
+_CMD_DNS = "nslookup google.com"
+_CMD_INTERNET = "curl -sSf -m 5 https://www.google.com > /dev/null 2>&1 && echo 'ok'"
+_CMD_PORTS = "ss -tuln -H -n"
+_CMD_UFW = "sudo ufw status | head -1"
+_CMD_SELINUX = "command -v getenforce && getenforce"
+_CMD_APPARMOR = "sudo aa-status 2>/dev/null | head -1"
+_CMD_DOCKER_VERSION = "docker --version"
+_CMD_DOCKER_PS = "docker ps"
+_REQUIRED_KERNEL_MODULES = ("overlay", "br_netfilter")
+
+
 class InfrastructureValidationError(Exception):
     """Raised when infrastructure validation fails."""
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class ValidationResult:
-    """Result of a validation check."""
+    """
+    Result of a validation check.
+
+    Immutable: details are stored as a read-only mapping. Results compare
+    and hash by identity, as the details values need not be hashable.
+    """
     check_name: str
     passed: bool
     message: str
     severity: str = "error"  # error, warning, info
-    details: Dict = field(default_factory=dict)
+    details: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "details", MappingProxyType(dict(self.details)))
+
+    def __reduce__(self):
+        # mappingproxy does not pickle; rebuild from a plain dict on load
+        return (
+            type(self),
+            (self.check_name, self.passed, self.message, self.severity, dict(self.details))
+        )
 
     def to_dict(self) -> Dict:
         return {
@@ -36,22 +70,24 @@ class ValidationResult:
             "passed": self.passed,
             "message": self.message,
             "severity": self.severity,
-            "details": self.details
+            "details": dict(self.details)
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class InfrastructureRequirements:
     """Infrastructure requirements for deployment."""
     min_cpu_cores: int = 4
     min_ram_gb: int = 8
     min_disk_gb: int = 50
-    required_ports: List[int] = field(default_factory=lambda: [22, 80, 443, 5432, 6379])
-    required_packages: List[str] = field(default_factory=lambda: ["docker", "python3", "git"])
+    required_ports: Tuple[int, ...] = field(default_factory=lambda: (22, 80, 443, 5432, 6379))
+    required_packages: Tuple[str, ...] = field(default_factory=lambda: ("docker", "python3", "git"))
+    required_services: Tuple[str, ...] = field(default_factory=lambda: ("docker",))
     docker_min_version: str = "24.0.0"
     check_swap: bool = True
     check_firewall: bool = True
     check_selinux: bool = True
+    ssh_connect_timeout: int = constants.SSH_CONNECT_TIMEOUT
 
 
 class InfrastructureValidator:
@@ -75,13 +111,50 @@ class InfrastructureValidator:
         self.vm_user = vm_user
         self.requirements = requirements or InfrastructureRequirements()
         self.results: List[ValidationResult] = []
+        self._probe_cache: Dict[str, subprocess.CompletedProcess] = {}
 
-    def validate_all(self, skip_warnings: bool = False) -> Tuple[bool, List[ValidationResult]]:
+    def validate_all(
+        self,
+        skip_warnings: bool = False,
+        reuse_probes: bool = False
+    ) -> Tuple[bool, List[ValidationResult]]:
         """
         Run all validation checks.
 
+        Synchronous wrapper around validate_all_async(). When called from
+        inside a running event loop the coroutine runs on a worker thread
+        with its own loop, since asyncio.run() cannot nest.
+
         Args:
             skip_warnings: If True, warnings won't cause validation to fail
+            reuse_probes: If True, reuse remote outputs cached by a previous run
+
+        Returns:
+            Tuple of (overall_success, list_of_results)
+        """
+        coro = self.validate_all_async(skip_warnings=skip_warnings, reuse_probes=reuse_probes)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def validate_all_async(
+        self,
+        skip_warnings: bool = False,
+        reuse_probes: bool = False
+    ) -> Tuple[bool, List[ValidationResult]]:
+        """
+        Run all validation checks, fetching the remote probes concurrently.
+
+        Raw SSH outputs are cached on the instance, so a back-to-back re-run
+        with reuse_probes=True (e.g. with different requirements or
+        skip_warnings) re-evaluates the checks without touching the network.
+
+        Args:
+            skip_warnings: If True, warnings won't cause validation to fail
+            reuse_probes: If True, reuse remote outputs cached by a previous run
 
         Returns:
             Tuple of (overall_success, list_of_results)
@@ -91,14 +164,20 @@ class InfrastructureValidator:
 
         # Reset results
         self.results = []
-
-        # Run all checks
-        self._check_ssh_connectivity()
-        self._check_system_resources()
-        self._check_network()
-        self._check_software_dependencies()
-        self._check_security()
-        self._check_docker_configuration()
+        if not reuse_probes:
+            self._probe_cache = {}
+
+        # Run all checks; every remaining check needs SSH, so skip them
+        # outright instead of paying one connect timeout per check.
+        if self._check_ssh_connectivity():
+            await self._prefetch_probes()
+            self._check_system_resources()
+            self._check_network()
+            self._check_software_dependencies()
+            self._check_security()
+            self._check_docker_configuration()
+        else:
+            self._skip_remote_checks("skipped: SSH unreachable")
 
         # Determine overall result
         errors = [r for r in self.results if not r.passed and r.severity == "error"]
@@ -132,35 +211,123 @@ class InfrastructureValidator:
             utils.log_success("✅ All validation checks passed!")
 
     def _ssh_command(self, command: str, check: bool = False) -> subprocess.CompletedProcess:
-        """Execute command on remote VM via SSH."""
-        return utils.ssh_command(
+        """Execute command on remote VM via SSH, memoizing the result for this validator."""
+        result = self._probe_cache.get(command)
+        if result is None:
+            result = utils.ssh_command(
+                self.vm_host,
+                self.vm_user,
+                command,
+                check=False,
+                connect_timeout=self.requirements.ssh_connect_timeout
+            )
+            self._probe_cache[command] = result
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+        return result
+
+    async def _assh_command(self, command: str) -> subprocess.CompletedProcess:
+        """Execute command on remote VM via SSH without blocking the event loop."""
+        return await utils.ssh_command_async(
             self.vm_host,
             self.vm_user,
             command,
-            check=check
+            check=False,
+            connect_timeout=self.requirements.ssh_connect_timeout
         )
 
-    def _check_ssh_connectivity(self) -> None:
-        """Validate SSH connectivity to target VM."""
+    def _probe_commands(self) -> List[str]:
+        """
+        Remote commands the checks always run, for the current requirements.
+
+        Fallback probes (the AppArmor query when SELinux is absent) are left
+        to their check, which runs them only when needed.
+        """
+        commands = [_CMD_NPROC, _CMD_FREE, _CMD_DF, _CMD_DNS, _CMD_INTERNET, _CMD_PORTS]
+        commands += [f"command -v {package}" for package in self.requirements.required_packages]
+        if self.requirements.check_firewall:
+            commands.append(_CMD_UFW)
+        if self.requirements.check_selinux:
+            commands.append(_CMD_SELINUX)
+        commands += [_CMD_DOCKER_VERSION, self._systemctl_command(self._service_units()), _CMD_DOCKER_PS]
+        commands += [f"lsmod | grep {module}" for module in _REQUIRED_KERNEL_MODULES]
+        return list(dict.fromkeys(commands))
+
+    async def _prefetch_probes(self) -> None:
+        """
+        Run the always-needed probe commands concurrently and cache the results.
+
+        Concurrency is capped at constants.SSH_MAX_PARALLEL so sshd's
+        MaxStartups limit does not drop connections. Failed probes are left
+        uncached so the owning check re-runs them and reports the error.
+        """
+        semaphore = asyncio.Semaphore(constants.SSH_MAX_PARALLEL)
+
+        async def fetch(command: str) -> subprocess.CompletedProcess:
+            async with semaphore:
+                return await self._assh_command(command)
+
+        commands = [c for c in self._probe_commands() if c not in self._probe_cache]
+        results = await asyncio.gather(*(fetch(c) for c in commands), return_exceptions=True)
+        for command, result in zip(commands, results):
+            if isinstance(result, subprocess.CompletedProcess):
+                self._probe_cache[command] = result
+
+    def _remote_check_names(self) -> List[str]:
+        """Names of the checks that run over SSH, in execution order."""
+        names = ["CPU Cores", "RAM", "Disk Space"]
+        if self.requirements.check_swap:
+            names.append("Swap Memory")
+        names += ["DNS Resolution", "Internet Connectivity", "Port Availability",
+                  "Software Dependencies"]
+        if self.requirements.check_firewall:
+            names.append("Firewall Configuration")
+        if self.requirements.check_selinux:
+            names.append("SELinux/AppArmor")
+        names += ["Docker Version", "Docker Service"]
+        names += [f"Service: {unit}" for unit in self.requirements.required_services if unit != "docker"]
+        names += ["Docker Permissions", "Kernel Modules"]
+        return names
+
+    def _skip_remote_checks(self, reason: str) -> None:
+        """Record every SSH-dependent check as failed without running it."""
+        for check_name in self._remote_check_names():
+            self.results.append(ValidationResult(
+                check_name=check_name,
+                passed=False,
+                message=reason,
+                severity="error"
+            ))
+
+    def _check_ssh_connectivity(self) -> bool:
+        """
+        Validate SSH connectivity to target VM.
+
+        Returns:
+            True if the VM is reachable over SSH, False otherwise
+        """
         check_name = "SSH Connectivity"
 
         try:
-            result = self._ssh_command("echo 'connected'", check=False)
+            result = self._ssh_command(_CMD_SSH_PROBE, check=False)
 
             if result.returncode == 0:
                 self.results.append(ValidationResult(
                     check_name=check_name,
                     passed=True,
                     message="SSH connection successful",
-                    severity="info"
-                ))
-            else:
-                self.results.append(ValidationResult(
-                    check_name=check_name,
-                    passed=False,
-                    message=f"SSH connection failed: {result.stderr}",
-                    severity="error"
+                    severity="info",
+                    # Non-interactive login succeeded, so key auth is working
+                    details={"auth": "publickey"}
                 ))
+                return True
+
+            self.results.append(ValidationResult(
+                check_name=check_name,
+                passed=False,
+                message=f"SSH connection failed: {result.stderr}",
+                severity="error"
+            ))
         except Exception as e:
             self.results.append(ValidationResult(
                 check_name=check_name,
@@ -168,6 +335,7 @@ class InfrastructureValidator:
                 message=f"SSH connection error: {str(e)}",
                 severity="error"
             ))
+        return False
 
     def _check_system_resources(self) -> None:
         """Validate system resources (CPU, RAM, disk)."""
@@ -189,7 +357,7 @@ class InfrastructureValidator:
         check_name = "CPU Cores"
 
         try:
-            result = self._ssh_command("nproc", check=False)
+            result = self._ssh_command(_CMD_NPROC, check=False)
 
             if result.returncode == 0:
                 cores = int(result.stdout.strip())
@@ -230,10 +398,10 @@ class InfrastructureValidator:
         check_name = "RAM"
 
         try:
-            result = self._ssh_command("free -g | awk '/^Mem:/ {print $2}'", check=False)
+            result = self._ssh_command(_CMD_FREE, check=False)
 
             if result.returncode == 0:
-                ram_gb = int(result.stdout.strip())
+                ram_gb = self._parse_free_bytes(result.stdout, "Mem:") // (1024 ** 3)
 
                 if ram_gb >= self.requirements.min_ram_gb:
                     self.results.append(ValidationResult(
@@ -271,26 +439,28 @@ class InfrastructureValidator:
         check_name = "Disk Space"
 
         try:
-            result = self._ssh_command("df -BG / | awk 'NR==2 {print $4}' | sed 's/G//'", check=False)
+            result = self._ssh_command(_CMD_DF, check=False)
 
             if result.returncode == 0:
-                disk_gb = int(result.stdout.strip())
+                # Header line, then the available byte count
+                avail_bytes = int(result.stdout.split()[1])
+                disk_gb = avail_bytes / (1024 ** 3)
 
                 if disk_gb >= self.requirements.min_disk_gb:
                     self.results.append(ValidationResult(
                         check_name=check_name,
                         passed=True,
-                        message=f"{disk_gb}GB free disk space (required: {self.requirements.min_disk_gb}GB)",
+                        message=f"{disk_gb:.2f}GB free disk space (required: {self.requirements.min_disk_gb}GB)",
                         severity="info",
-                        details={"disk_gb": disk_gb, "required_gb": self.requirements.min_disk_gb}
+                        details={"disk_gb": round(disk_gb, 2), "required_gb": self.requirements.min_disk_gb}
                     ))
                 else:
                     self.results.append(ValidationResult(
                         check_name=check_name,
                         passed=False,
-                        message=f"Insufficient disk space: {disk_gb}GB (required: {self.requirements.min_disk_gb}GB)",
+                        message=f"Insufficient disk space: {disk_gb:.2f}GB (required: {self.requirements.min_disk_gb}GB)",
                         severity="error",
-                        details={"disk_gb": disk_gb, "required_gb": self.requirements.min_disk_gb}
+                        details={"disk_gb": round(disk_gb, 2), "required_gb": self.requirements.min_disk_gb}
                     ))
             else:
                 self.results.append(ValidationResult(
@@ -312,10 +482,10 @@ class InfrastructureValidator:
         check_name = "Swap Memory"
 
         try:
-            result = self._ssh_command("free -g | awk '/^Swap:/ {print $2}'", check=False)
+            result = self._ssh_command(_CMD_FREE, check=False)
 
             if result.returncode == 0:
-                swap_gb = int(result.stdout.strip())
+                swap_gb = self._parse_free_bytes(result.stdout, "Swap:") // (1024 ** 3)
 
                 if swap_gb > 0:
                     self.results.append(ValidationResult(
@@ -352,7 +522,7 @@ class InfrastructureValidator:
         check_name = "DNS Resolution"
 
         try:
-            result = self._ssh_command("nslookup google.com", check=False)
+            result = self._ssh_command(_CMD_DNS, check=False)
 
             if result.returncode == 0:
                 self.results.append(ValidationResult(
@@ -381,7 +551,7 @@ class InfrastructureValidator:
         check_name = "Internet Connectivity"
 
         try:
-            result = self._ssh_command("curl -sSf -m 5 https://www.google.com > /dev/null 2>&1 && echo 'ok'", check=False)
+            result = self._ssh_command(_CMD_INTERNET, check=False)
 
             if result.returncode == 0 and "ok" in result.stdout:
                 self.results.append(ValidationResult(
@@ -412,14 +582,13 @@ class InfrastructureValidator:
         try:
             # Check if ports are listening (should NOT be for fresh deployment)
             ports_str = " ".join(str(p) for p in self.requirements.required_ports)
-            cmd = f"ss -tuln | grep -E '({'|'.join(str(p) for p in self.requirements.required_ports)})' || echo 'none'"
-
-            result = self._ssh_command(cmd, check=False)
+            result = self._ssh_command(_CMD_PORTS, check=False)
 
             if result.returncode == 0:
-                output = result.stdout.strip()
+                listening = self._parse_listening_ports(result.stdout)
+                used_ports = sorted(set(self.requirements.required_ports) & listening)
 
-                if output == "none" or not output:
+                if not used_ports:
                     self.results.append(ValidationResult(
                         check_name=check_name,
                         passed=True,
@@ -427,21 +596,13 @@ class InfrastructureValidator:
                         severity="info"
                     ))
                 else:
-                    # Parse which ports are in use
-                    used_ports = []
-                    for line in output.split('\n'):
-                        for port in self.requirements.required_ports:
-                            if f":{port}" in line:
-                                used_ports.append(port)
-
-                    if used_ports:
-                        self.results.append(ValidationResult(
-                            check_name=check_name,
-                            passed=False,
-                            message=f"Ports already in use: {', '.join(map(str, set(used_ports)))}",
-                            severity="warning",
-                            details={"used_ports": list(set(used_ports))}
-                        ))
+                    self.results.append(ValidationResult(
+                        check_name=check_name,
+                        passed=False,
+                        message=f"Ports already in use: {', '.join(map(str, used_ports))}",
+                        severity="warning",
+                        details={"used_ports": used_ports}
+                    ))
         except Exception as e:
             self.results.append(ValidationResult(
                 check_name=check_name,
@@ -491,16 +652,13 @@ class InfrastructureValidator:
         if self.requirements.check_selinux:
             self._check_selinux_apparmor()
 
-        # Check SSH key authentication
-        self._check_ssh_key_auth()
-
     def _check_firewall_status(self) -> None:
         """Check firewall configuration."""
         check_name = "Firewall Configuration"
 
         try:
             # Check if ufw is active
-            result = self._ssh_command("sudo ufw status | head -1", check=False)
+            result = self._ssh_command(_CMD_UFW, check=False)
 
             if result.returncode == 0:
                 status = result.stdout.strip()
@@ -529,7 +687,7 @@ class InfrastructureValidator:
 
         try:
             # Check SELinux
-            result = self._ssh_command("command -v getenforce && getenforce", check=False)
+            result = self._ssh_command(_CMD_SELINUX, check=False)
 
             if result.returncode == 0:
                 status = result.stdout.strip()
@@ -551,7 +709,7 @@ class InfrastructureValidator:
                     ))
             else:
                 # Check AppArmor
-                result = self._ssh_command("sudo aa-status 2>/dev/null | head -1", check=False)
+                result = self._ssh_command(_CMD_APPARMOR, check=False)
 
                 if result.returncode == 0 and result.stdout:
                     self.results.append(ValidationResult(
@@ -564,26 +722,15 @@ class InfrastructureValidator:
             # Security module check is optional
             pass
 
-    def _check_ssh_key_auth(self) -> None:
-        """Verify SSH key authentication is working."""
-        check_name = "SSH Key Authentication"
-
-        # This is implicitly checked by SSH connectivity test
-        # If we got here, SSH key auth is working
-        self.results.append(ValidationResult(
-            check_name=check_name,
-            passed=True,
-            message="SSH key authentication verified",
-            severity="info"
-        ))
-
     def _check_docker_configuration(self) -> None:
         """Validate Docker installation and configuration."""
         # Check Docker version
         self._check_docker_version()
 
-        # Check Docker service status
-        self._check_docker_service()
+        # Check Docker (and any other required) service status in one query
+        states = self._query_service_states(self._service_units())
+        self._check_docker_service(states)
+        self._check_required_services(states)
 
         # Check Docker permissions
         self._check_docker_permissions()
@@ -596,7 +743,7 @@ class InfrastructureValidator:
         check_name = "Docker Version"
 
         try:
-            result = self._ssh_command("docker --version", check=False)
+            result = self._ssh_command(_CMD_DOCKER_VERSION, check=False)
 
             if result.returncode == 0:
                 version_match = re.search(r'(\d+\.\d+\.\d+)', result.stdout)
@@ -644,41 +791,86 @@ class InfrastructureValidator:
                 severity="error"
             ))
 
-    def _check_docker_service(self) -> None:
+    def _service_units(self) -> Tuple[str, ...]:
+        """Systemd units to query: Docker plus any additionally required services."""
+        return tuple(dict.fromkeys(("docker", *self.requirements.required_services)))
+
+    @staticmethod
+    def _systemctl_command(units: Tuple[str, ...]) -> str:
+        return f"systemctl is-active {' '.join(units)} 2>/dev/null"
+
+    def _query_service_states(self, units: Tuple[str, ...]) -> Dict[str, str]:
+        """
+        Query the state of several systemd units with a single SSH call.
+
+        `systemctl is-active` prints one state per unit in argument order,
+        so the output zips straight back onto the unit names.
+
+        Returns:
+            Mapping of unit name to state (e.g. "active"); empty on error
+        """
+        try:
+            result = self._ssh_command(self._systemctl_command(units), check=False)
+        except Exception:
+            return {}
+        return dict(zip(units, (result.stdout or "").split()))
+
+    def _check_docker_service(self, states: Dict[str, str]) -> None:
         """Check if Docker service is running."""
         check_name = "Docker Service"
 
-        try:
-            result = self._ssh_command("systemctl is-active docker", check=False)
+        state = states.get("docker")
+        if state == "active":
+            self.results.append(ValidationResult(
+                check_name=check_name,
+                passed=True,
+                message="Docker service is running",
+                severity="info"
+            ))
+        elif state is None:
+            self.results.append(ValidationResult(
+                check_name=check_name,
+                passed=False,
+                message="Docker service check error: no state reported by systemctl",
+                severity="error"
+            ))
+        else:
+            self.results.append(ValidationResult(
+                check_name=check_name,
+                passed=False,
+                message="Docker service is not running",
+                severity="error",
+                details={"state": state}
+            ))
 
-            if result.returncode == 0 and "active" in result.stdout:
+    def _check_required_services(self, states: Dict[str, str]) -> None:
+        """Check any additional required services besides Docker."""
+        for unit in self.requirements.required_services:
+            if unit == "docker":
+                continue
+            state = states.get(unit, "unknown")
+            if state == "active":
                 self.results.append(ValidationResult(
-                    check_name=check_name,
+                    check_name=f"Service: {unit}",
                     passed=True,
-                    message="Docker service is running",
+                    message=f"{unit} service is running",
                     severity="info"
                 ))
             else:
                 self.results.append(ValidationResult(
-                    check_name=check_name,
+                    check_name=f"Service: {unit}",
                     passed=False,
-                    message="Docker service is not running",
-                    severity="error"
+                    message=f"{unit} service is not running ({state})",
+                    severity="error",
+                    details={"state": state}
                 ))
-        except Exception as e:
-            self.results.append(ValidationResult(
-                check_name=check_name,
-                passed=False,
-                message=f"Docker service check error: {str(e)}",
-                severity="error"
-            ))
 
     def _check_docker_permissions(self) -> None:
         """Check if user has Docker permissions."""
         check_name = "Docker Permissions"
 
         try:
-            result = self._ssh_command("docker ps", check=False)
+            result = self._ssh_command(_CMD_DOCKER_PS, check=False)
 
             if result.returncode == 0:
                 self.results.append(ValidationResult(
@@ -715,7 +907,7 @@ class InfrastructureValidator:
         """Check required kernel modules."""
         check_name = "Kernel Modules"
 
-        required_modules = ["overlay", "br_netfilter"]
+        required_modules = _REQUIRED_KERNEL_MODULES
         missing_modules = []
 
         for module in required_modules:
@@ -743,6 +935,28 @@ class InfrastructureValidator:
                 details={"missing": missing_modules}
             ))
 
+    @staticmethod
+    def _parse_free_bytes(output: str, row: str) -> int:
+        """Return the 'total' column of the given row (e.g. 'Mem:') from `free -b`."""
+        for line in output.splitlines():
+            fields = line.split()
+            if fields and fields[0] == row:
+                return int(fields[1])
+        raise ValueError(f"'{row}' row not found in free output")
+
+    @staticmethod
+    def _parse_listening_ports(output: str) -> set:
+        """Collect local port numbers from headerless `ss -tuln -H -n` output."""
+        ports = set()
+        for line in output.splitlines():
+            fields = line.split()
+            if len(fields) < 5:
+                continue
+            _, _, port = fields[4].rpartition(":")
+            if port.isdigit():
+                ports.add(int(port))
+        return ports
+
     @staticmethod
     def _compare_versions(version1: str, version2: str) -> int:
         """
@@ -825,3 +1039,49 @@ def validate_infrastructure(
         validator.export_results(results_file)
 
     return success
+
+
+def _validate_target(
+    target: Tuple[str, str],
+    requirements: Optional[InfrastructureRequirements]
+) -> Tuple[bool, List[ValidationResult]]:
+    """Validate a single (vm_host, vm_user) target; module-level so it pickles."""
+    vm_host, vm_user = target
+    validator = InfrastructureValidator(vm_host, vm_user, requirements)
+    return validator.validate_all(skip_warnings=False)
+
+
+def _init_fleet_worker(identity: Optional[Path], debug: bool) -> None:
+    """Carry the parent's SSH identity and debug flag into a worker process."""
+    utils.set_default_ssh_identity(identity)
+    utils.DebugContext.set_debug(debug)
+
+
+def validate_infrastructure_fleet(
+    targets: List[Tuple[str, str]],
+    requirements: Optional[InfrastructureRequirements] = None,
+    max_workers: Optional[int] = None
+) -> Dict[Tuple[str, str], Tuple[bool, List[ValidationResult]]]:
+    """
+    Validate several VMs concurrently in a pool of worker processes.
+
+    Args:
+        targets: List of (vm_host, vm_user) tuples
+        requirements: Infrastructure requirements shared by all targets
+        max_workers: Worker process limit (defaults to
+            min(constants.SSH_MAX_PARALLEL, len(targets)))
+
+    Returns:
+        Mapping of target to its (success, results) tuple
+    """
+    if not targets:
+        return {}
+
+    workers = max_workers or min(constants.SSH_MAX_PARALLEL, len(targets))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_fleet_worker,
+        initargs=(utils.get_default_ssh_identity(), utils.DebugContext.is_debug())
+    ) as executor:
+        futures = {executor.submit(_validate_target, t, requirements): t for t in targets}
+        return {futures[f]: f.result() for f in as_completed(futures)}
@@ -7,8 +7,16 @@ This module handles:
 - Remote NixOS installation via SSH
 """
 
+import functools
+import json
+import os
+import re
 import shutil
+import string
+import subprocess
 import sys
+import threading
+import uuid
 import yaml
 from pathlib import Path
 from typing import List, Optional
@@ -17,12 +25,39 @@ from . import constants
 from . import utils
 from . import remote_executor
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+# Staged flake.nix; string.Template avoids f-string brace conflicts with Nix
+# syntax and fills both placeholders in a single pass. Any literal '$' in the
+# Nix source must be written as '$$'.
+_FLAKE_TEMPLATE = string.Template("""{
+  description = "Declarative PaaS Configuration (staged)";
+
+  inputs = {
+    nixpkgs.url = "github:NixOS/nixpkgs/nixos-unstable";
+  };
+
+  outputs = { self, nixpkgs, ... }@inputs: {
+    nixosConfigurations.server1 = { userConfig ? ${usercfg} }: nixpkgs.lib.nixosSystem {
+      system = "x86_64-linux";
+      specialArgs = { inherit inputs userConfig; };
+      modules = [
+${modules}
+      ];
+    };
+  };
+}
+""")
+
+
+@functools.lru_cache(maxsize=None)
 def service_id_to_module_filename(service_id: str) -> str:
     """
     Map a service id from selection.yml to an expected module filename.
 
-    Falls back to '<id>.nix' with known special cases.
+    Falls back to '<id>.nix' with known special cases. Memoized, as
+    constants.SERVICE_MODULE_MAPPINGS does not change at runtime.
 
     Args:
         service_id: Service identifier from selection.yml
@@ -34,6 +69,146 @@ def service_id_to_module_filename(service_id: str) -> str:
     return f"{base}.nix"
 
 
+def _clean_str(value) -> str:
+    """Return value as a stripped string; None and missing keys become ''."""
+    if isinstance(value, str):
+        return value.strip()
+    return "" if value is None else str(value).strip()
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """
+    Load a YAML mapping, reusing a JSON sidecar cache when it is current.
+
+    Sidecars live under constants.YAML_CACHE_DIR (not next to the YAML, which
+    sits in the ms-config repo) and record the source's mtime and size.
+    Data is only cached if it survives a JSON round trip unchanged (no
+    dates, non-string keys, ...).
+
+    Raises:
+        OSError, yaml.YAMLError: If the YAML itself cannot be read or parsed
+    """
+    st = path.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+    cache_file = constants.YAML_CACHE_DIR / (
+        str(path.resolve()).strip(os.sep).replace(os.sep, "__") + ".json"
+    )
+
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if cached.get("stamp") == stamp:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
+
+    try:
+        payload = json.dumps({"stamp": stamp, "data": data})
+        if json.loads(payload)["data"] == data:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(payload, encoding="utf-8")
+            os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return data
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy one file in-kernel with os.copy_file_range, then its metadata.
+
+    Falls back to shutil.copy2 where copy_file_range is unavailable
+    (non-Linux, old kernels, or unsupported filesystem pairs).
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        if remaining > 0:
+            raise OSError("short copy_file_range")
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+def _copy_into(src_root: Path, rel_paths: List[str], dst_root: Path) -> None:
+    """
+    Copy files/directories given relative to src_root into dst_root, keeping
+    their relative layout and permission bits.
+
+    Uses a single `tar | tar` stream when tar is available, which replaces
+    one copy + stat/chmod round per file with two processes; falls back to
+    per-file in-kernel copies otherwise.
+
+    Raises:
+        subprocess.CalledProcessError: If either side of the tar stream fails
+    """
+    tar = shutil.which("tar")
+    if tar:
+        packer = subprocess.Popen(
+            [tar, "-C", str(src_root), "-cf", "-", "--", *rel_paths],
+            stdout=subprocess.PIPE,
+        )
+        assert packer.stdout is not None
+        try:
+            unpacker = subprocess.run([tar, "-C", str(dst_root), "-xf", "-"], stdin=packer.stdout)
+        finally:
+            packer.stdout.close()
+        pack_rc = packer.wait()
+        if pack_rc != 0:
+            raise subprocess.CalledProcessError(pack_rc, packer.args)
+        if unpacker.returncode != 0:
+            raise subprocess.CalledProcessError(unpacker.returncode, unpacker.args)
+        return
+
+    for rel in rel_paths:
+        src = src_root / rel
+        dst = dst_root / rel
+        if src.is_dir():
+            shutil.copytree(src, dst, copy_function=_copy_file, dirs_exist_ok=True)
+        else:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            _copy_file(src, dst)
+
+
+def _remove_old_trees(target: Path) -> None:
+    """Delete every '<target>.old-<pid>-<id>' tree left beside target by _swap_into_place."""
+    # Match the exact generated names: a tenant may itself be called 'foo.old'
+    old_re = re.compile(rf"{re.escape(target.name)}\.old-\d+-[0-9a-f]{{8}}")
+    with os.scandir(target.parent) as it:
+        old_dirs = [e.path for e in it if old_re.fullmatch(e.name) and e.is_dir(follow_symlinks=False)]
+    for path in old_dirs:
+        # Nothing is ever renamed onto these names again, so a partial
+        # removal is simply retried by the next sweep
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _swap_into_place(build_dir: Path, target: Path) -> None:
+    """
+    Atomically replace target with build_dir via renames.
+
+    The previous tree is moved aside under a unique '.old-<pid>-<id>' name
+    and deleted, together with leftovers from earlier runs, on a background
+    thread so the O(files) removal stays off the staging critical path. The
+    thread is non-daemon: the interpreter waits for it before exiting.
+    """
+    if target.exists():
+        os.replace(target, target.with_name(f"{target.name}.old-{os.getpid()}-{uuid.uuid4().hex[:8]}"))
+    os.replace(build_dir, target)
+    threading.Thread(target=_remove_old_trees, args=(target,), name="nix-stage-cleanup").start()
+
+
 def stage_nix_solution_for_tenant(tenant_name: str) -> Path:
     """
     Create a minimal nix-solution directory containing only general files
@@ -61,8 +236,7 @@ def stage_nix_solution_for_tenant(tenant_name: str) -> Path:
 
     # Load selection.yml
     try:
-        with open(selection_path, 'r') as f:
-            selection = yaml.safe_load(f) or {}
+        selection = _load_yaml_cached(selection_path)
     except Exception as e:
         print(f"❌ Failed to parse selection.yml: {e}")
         sys.exit(1)
@@ -74,14 +248,13 @@ def stage_nix_solution_for_tenant(tenant_name: str) -> Path:
     general_cfg = {}
     if general_path.exists():
         try:
-            with open(general_path, 'r') as f:
-                general_cfg = yaml.safe_load(f) or {}
+            general_cfg = _load_yaml_cached(general_path)
         except Exception as e:
             print(f"⚠️ Failed to parse {general_path}: {e}")
     else:
         print(f"⚠️ General config not found: {general_path}")
 
-    deployment_target = str(general_cfg.get("deployment_target", "")).strip()
+    deployment_target = _clean_str(general_cfg.get("deployment_target"))
 
     # Load install_config.yaml to derive network defaults for the deployment target
     install_cfg = utils.read_install_config()
@@ -91,108 +264,104 @@ def stage_nix_solution_for_tenant(tenant_name: str) -> Path:
 
     def first_username(users: list) -> str:
         if isinstance(users, list) and users and isinstance(users[0], dict):
-            return str(users[0].get("username", "")).strip()
+            return _clean_str(users[0].get("username"))
         return ""
 
     # Username default: universal_username -> first install user -> fallback "nixuser"
-    default_username = str(general_cfg.get("universal_username", "")).strip() or first_username(vm_users) or constants.DEFAULT_NIX_USERNAME
+    default_username = _clean_str(general_cfg.get("universal_username")) or first_username(vm_users) or constants.DEFAULT_NIX_USERNAME
 
     # Network defaults
-    addr_cidr = str(vm_net.get("address_cidr", "")).strip()
-    address = utils.ip_from_cidr(addr_cidr) if addr_cidr else ""
+    address, has_prefix, prefix_str = _clean_str(vm_net.get("address_cidr")).partition("/")
+    address = address.strip()
     prefix = None
-    if "/" in addr_cidr:
+    if has_prefix:
         try:
-            prefix = int(addr_cidr.split("/", 1)[1].strip())
-        except Exception:
+            prefix = int(prefix_str.strip())
+        except ValueError:
             prefix = None
-    gateway = str(vm_net.get("gateway", "")).strip()
-    dns_list = vm_net.get("dns", []) if isinstance(vm_net.get("dns", []), list) else []
-    interface = str(vm_net.get("interface", "")).strip()  # optional explicit interface name
+    gateway = _clean_str(vm_net.get("gateway"))
+    dns_list = dns if isinstance(dns := vm_net.get("dns", []), list) else []
+    interface = _clean_str(vm_net.get("interface"))  # optional explicit interface name
 
     # Build userConfig default in Nix syntax
     # Only include attributes that have values to keep it minimal
-    user_cfg_lines = [f'  username = "{utils.nix_escape_string(default_username)}";']
+    nix_escape = utils.nix_escape_string
+    user_cfg_lines = [f'  username = "{nix_escape(default_username)}";']
 
     net_attr_lines: List[str] = []
+    add_net_attr = net_attr_lines.append
     if address and prefix is not None:
-        net_attr_lines.append(f'    address = "{utils.nix_escape_string(address)}";')
-        net_attr_lines.append(f'    prefixLength = {prefix};')
+        add_net_attr(f'    address = "{nix_escape(address)}";')
+        add_net_attr(f'    prefixLength = {prefix};')
     if gateway:
-        net_attr_lines.append(f'    gateway = "{utils.nix_escape_string(gateway)}";')
+        add_net_attr(f'    gateway = "{nix_escape(gateway)}";')
     if dns_list:
-        dns_items = " ".join([f'"{utils.nix_escape_string(x)}"' for x in dns_list if str(x).strip()])
+        dns_items = " ".join(f'"{nix_escape(str(x))}"' for x in dns_list if x and str(x).strip())
         if dns_items:
-            net_attr_lines.append(f'    nameservers = [ {dns_items} ];')
+            add_net_attr(f'    nameservers = [ {dns_items} ];')
     if interface:
-        net_attr_lines.append(f'    interface = "{utils.nix_escape_string(interface)}";')
+        add_net_attr(f'    interface = "{nix_escape(interface)}";')
 
     user_cfg_default = "{\n" + "\n".join(user_cfg_lines)
     if net_attr_lines:
         user_cfg_default += "\n  network = {\n" + "\n".join(net_attr_lines) + "\n  };"
     user_cfg_default += "\n}"
 
-    # Build list of module files to include
-    include_modules: List[Path] = []
+    # Build list of module filenames to include; one directory read instead
+    # of a stat() per enabled service (DirEntry.is_file() uses the cached
+    # d_type, so it is free on Linux)
+    try:
+        with os.scandir(services_src) as entries:
+            available = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        available = set()
+
+    include_modules: List[str] = []
     missing: List[str] = []
     for sid in sorted(enabled_ids):
         fname = service_id_to_module_filename(sid)
-        candidate = services_src / fname
-        if candidate.exists():
-            include_modules.append(candidate)
+        if fname in available:
+            include_modules.append(fname)
         else:
             missing.append(sid)
 
-    # Prepare staging directory
+    # Prepare staging directory next to the final location, then rename it into place
     staged_root = constants.STAGED_ROOT_DIR / f"nix-solution-{tenant_name}"
-    if staged_root.exists():
-        shutil.rmtree(staged_root)
-    (staged_root / "modules" / "services").mkdir(parents=True, exist_ok=True)
-
-    # Copy general files
-    shutil.copy2(nix_src / "install.sh", staged_root / "install.sh")
-    # Copy hosts entirely to allow interactive selection; install.sh will prune later
-    shutil.copytree(nix_src / "hosts", staged_root / "hosts")
-    # Copy common.nix
-    shutil.copy2(nix_src / "modules" / "common.nix", staged_root / "modules" / "common.nix")
-
-    # Copy only selected service modules
-    for mod_path in include_modules:
-        shutil.copy2(mod_path, staged_root / "modules" / "services" / mod_path.name)
+    build_root = staged_root.with_name(f"{staged_root.name}.new")
+    shutil.rmtree(build_root, ignore_errors=True)
+    (build_root / "modules" / "services").mkdir(parents=True, exist_ok=True)
+
+    # Copy general files, hosts entirely (to allow interactive selection;
+    # install.sh will prune later), common.nix and only the selected service
+    # modules in one batch
+    services_rel = services_src.relative_to(nix_src)
+    _copy_into(
+        nix_src,
+        [
+            "install.sh",
+            "hosts",
+            "modules/common.nix",
+            *(str(services_rel / fname) for fname in include_modules),
+        ],
+        build_root,
+    )
 
     # Compose flake.nix with only selected modules and embedded userConfig default
     module_import_lines = ["        ./hosts/server1/default.nix", "        ./modules/common.nix"]
-    for mod_path in include_modules:
-        rel = f"./modules/services/{mod_path.name}"
-        module_import_lines.append(f"        {rel}")
-
-    # Build flake content safely without f-string brace conflicts
-    template = """{
-  description = "Declarative PaaS Configuration (staged)";
+    module_import_lines += [f"        ./modules/services/{fname}" for fname in include_modules]
 
-  inputs = {
-    nixpkgs.url = "github:NixOS/nixpkgs/nixos-unstable";
-  };
+    flake_content = _FLAKE_TEMPLATE.substitute(
+        usercfg=user_cfg_default,
+        modules="\n".join(module_import_lines),
+    )
 
-  outputs = { self, nixpkgs, ... }@inputs: {
-    nixosConfigurations.server1 = { userConfig ? <<USERCFG>> }: nixpkgs.lib.nixosSystem {
-      system = "x86_64-linux";
-      specialArgs = { inherit inputs userConfig; };
-      modules = [
-<<MODULES>>
-      ];
-    };
-  };
-}
-"""
-    flake_content = template.replace("<<USERCFG>>", user_cfg_default).replace("<<MODULES>>", "\n".join(module_import_lines))
+    (build_root / "flake.nix").write_bytes(flake_content.encode("utf-8"))
 
-    with open(staged_root / "flake.nix", "w", encoding="utf-8") as f:
-        f.write(flake_content)
+    _swap_into_place(build_root, staged_root)
 
     print("📦 Staged nix-solution with the following service modules:")
-    for p in include_modules:
-        print(f"  - {p.name}")
+    for fname in include_modules:
+        print(f"  - {fname}")
     if missing:
         print("⚠️ Missing module files for enabled services (skipped):")
         for sid in missing:
@@ -247,32 +416,17 @@ def install_nixos_flake_via_ssh(
         print(f"❌ Local nix-solution directory not found at {src_dir}")
         sys.exit(1)
 
-    # Ensure remote target directory is clean
-    utils.ssh_command(
+    # Replace ~/nix-solution with the directory contents in one streamed
+    # upload; extracting into the fixed name keeps the install.sh path
+    # consistent whatever the local directory is called. The upload opens the
+    # multiplexed master that the install command below reuses.
+    utils.ssh_tar_upload(
         host,
         ssh_user,
-        "rm -rf ~/nix-solution && mkdir -p ~",
-        check=False,
+        src_dir,
+        "~/nix-solution",
     )
 
-    # Copy the nix flake directory to home
-    utils.scp_upload(
-        host,
-        ssh_user,
-        str(src_dir),
-        "~/",
-        recursive=True,
-    )
-
-    # If the directory name is not 'nix-solution', rename it remotely so install.sh path is consistent
-    if src_dir.name != "nix-solution":
-        utils.ssh_command(
-            host,
-            ssh_user,
-            f"rm -rf ~/nix-solution && mv ~/{src_dir.name} ~/nix-solution",
-            check=False,
-        )
-
     # Execute the install script with default choices (send an empty line)
     remote_cmd = (
         "set -euo pipefail; "
@@ -39,13 +39,14 @@ def provision_proxmox_vm(vm_name: str, username: str) -> None:
         "--username",
         username,
     ]
-    if utils.DebugContext.is_debug():
+    debug = utils.DebugContext.is_debug()
+    if debug:
         command.append("--debug")
 
     try:
         token = utils.load_proxmox_api_token()
         env_map = {constants.ENV_PROXMOX_API_TOKEN: token}
-        if utils.DebugContext.is_debug():
+        if debug:
             env_map[constants.ENV_ORCH_DEBUG] = "1"
         utils.run_command(command, cwd=constants.OS_INSTALL_DIR, env=env_map)
         utils.log_success(f"Proxmox VM '{vm_name}' provisioned successfully.")
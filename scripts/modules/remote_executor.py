@@ -5,43 +5,80 @@ This module provides intelligent remote execution that prefers Mosh when
 available on both ends, falling back to SSH when necessary.
 """
 
+import functools
 import os
 import shlex
 import shutil
 import subprocess
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 
 from . import constants
 from . import utils
 
 
+# remote -> (probe time, mosh-server available)
+_MOSH_SERVER_CACHE: Dict[str, Tuple[float, bool]] = {}
+
+
+@functools.lru_cache(maxsize=1)
 def has_local_mosh() -> bool:
     """
     Check if mosh is available on the orchestrator machine.
 
+    The result is cached for the lifetime of the process.
+
     Returns:
         True if mosh is in PATH, False otherwise
     """
     return shutil.which("mosh") is not None
 
 
+def _remote_probe_ttl() -> Optional[float]:
+    """
+    Cache lifetime for remote probes from PAAS_REMOTE_PROBE_TTL.
+
+    Returns:
+        Seconds to keep a probe result, or None to keep it for the whole run
+    """
+    raw = os.environ.get(constants.ENV_REMOTE_PROBE_TTL)
+    if raw is None or not raw.strip():
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return None
+
+
 def remote_has_mosh_server(remote: str) -> bool:
     """
     Check if mosh-server is available on the remote host.
 
+    Results are cached per remote; set PAAS_REMOTE_PROBE_TTL to bound the
+    cache lifetime in seconds (0 re-probes on every call).
+
     Args:
         remote: SSH connection string (user@host)
 
     Returns:
         True if mosh-server is available on remote, False otherwise
     """
+    ttl = _remote_probe_ttl()
+    cached = _MOSH_SERVER_CACHE.get(remote)
+    if cached is not None and (ttl is None or time.monotonic() - cached[0] < ttl):
+        return cached[1]
+
+    available = _probe_remote_mosh_server(remote)
+    _MOSH_SERVER_CACHE[remote] = (time.monotonic(), available)
+    return available
+
+
+def _probe_remote_mosh_server(remote: str) -> bool:
+    """Run the uncached SSH probe for mosh-server on remote."""
     try:
         ssh_cmd = [
             "ssh",
-            *utils.ssh_identity_args(),
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "UserKnownHostsFile=/dev/null",
-            "-o", f"ConnectTimeout={constants.SSH_CONNECT_TIMEOUT}",
+            *utils.ssh_base_args(multiplex=True),
             remote,
             "command -v mosh-server >/dev/null 2>&1 && echo yes || echo no",
         ]
@@ -62,7 +99,8 @@ def run_remote_prefer_mosh(remote: str, remote_cmd: str) -> subprocess.Completed
     Execute a remote command preferring mosh if available on both ends.
 
     Falls back to SSH if mosh is not available. Note: File transfers and
-    readiness checks still use SSH/SCP.
+    readiness checks still use SSH/SCP. The SSH side joins the multiplexed
+    master opened by the mosh-server probe, so only one handshake is paid.
 
     Args:
         remote: SSH connection string (user@host)
@@ -74,14 +112,7 @@ def run_remote_prefer_mosh(remote: str, remote_cmd: str) -> subprocess.Completed
     Raises:
         subprocess.CalledProcessError: If command fails and check=True
     """
-    identity_args = utils.ssh_identity_args()
-    ssh_base = [
-        "ssh",
-        *identity_args,
-        "-o", "StrictHostKeyChecking=no",
-        "-o", "UserKnownHostsFile=/dev/null",
-        "-o", f"ConnectTimeout={constants.SSH_CONNECT_TIMEOUT}",
-    ]
+    ssh_base = ["ssh", *utils.ssh_base_args(multiplex=True)]
 
     if has_local_mosh() and remote_has_mosh_server(remote):
         print(f"🌐 Using mosh for remote command on {remote}")
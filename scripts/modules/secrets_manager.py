@@ -7,17 +7,38 @@ secure distribution to target VMs.
 """
 
 import base64
+import functools
 import hashlib
 import json
 import os
+import shutil
+import stat
 import subprocess
 import tarfile
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 from . import constants, utils
 
+try:
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:  # cryptography is optional; fall back to the openssl CLI
+    Cipher = None
+
+# Header written by `openssl enc -salt`; the remote side still decrypts with
+# the openssl CLI, so bundles must stay byte-compatible with it.
+_OPENSSL_MAGIC = b"Salted__"
+_OPENSSL_SALT_LEN = 8
+_CIPHER_CHUNK_SIZE = 1 << 20
+_DEPLOY_STATE_FILE = ".deploy_state.json"
+# Guards the read-modify-write of .deploy_state.json across fan-out threads
+_DEPLOY_STATE_LOCK = threading.Lock()
+
 
 class SecretsError(Exception):
     """Raised when secrets operations fail."""
@@ -42,17 +63,19 @@ class SecretsManager:
     def encrypt_credentials(
         self,
         credentials_dir: Path,
-        encryption_key: Optional[str] = None
-    ) -> Path:
+        encryption_key: Optional[str] = None,
+        save_key_file: bool = True
+    ) -> Tuple[Path, str]:
         """
         Encrypt credentials directory into a secure bundle.
 
         Args:
             credentials_dir: Directory containing credential files
             encryption_key: Optional encryption key (auto-generated if not provided)
+            save_key_file: If True, also write the key next to the bundle for operator reference
 
         Returns:
-            Path to encrypted bundle
+            Tuple of (bundle_path, encryption_key)
 
         Raises:
             SecretsError: If encryption fails
@@ -76,7 +99,7 @@ class SecretsManager:
 
             # Create tar archive
             with tarfile.open(temp_archive, 'w:gz') as tar:
-                tar.add(credentials_dir, arcname=bundle_name)
+                _add_tree_numeric(tar, credentials_dir, bundle_name)
 
             # Encrypt with openssl (AES-256-CBC)
             self._encrypt_file(temp_archive, bundle_path, encryption_key)
@@ -84,86 +107,110 @@ class SecretsManager:
             # Remove temporary unencrypted archive
             temp_archive.unlink()
 
-            # Save encryption key separately (for operator reference)
-            key_file = self.secrets_dir / f"{bundle_name}.key"
-            with open(key_file, 'w') as f:
-                f.write(encryption_key)
-
             # Restrict permissions
             os.chmod(bundle_path, 0o600)
-            os.chmod(key_file, 0o600)
-
             utils.log_success(f"✅ Credentials encrypted: {bundle_path}")
-            utils.log_info(f"   Encryption key saved to: {key_file}")
-            utils.log_warn("⚠️  Keep the encryption key secure!")
 
-            return bundle_path
+            # Save encryption key separately (for operator reference)
+            if save_key_file:
+                key_file = self.secrets_dir / f"{bundle_name}.key"
+                with open(key_file, 'w') as f:
+                    f.write(encryption_key)
+                os.chmod(key_file, 0o600)
+                utils.log_info(f"   Encryption key saved to: {key_file}")
+                utils.log_warn("⚠️  Keep the encryption key secure!")
+
+            return bundle_path, encryption_key
 
         except Exception as e:
             raise SecretsError(f"Failed to encrypt credentials: {e}") from e
 
     def _encrypt_file(self, input_file: Path, output_file: Path, key: str) -> None:
         """
-        Encrypt file using OpenSSL AES-256-CBC.
+        Encrypt file using AES-256-CBC in the `openssl enc -salt` format.
+
+        Runs in-process through cryptography (AES-NI via OpenSSL's EVP layer)
+        when available, otherwise spawns the openssl CLI.
 
         Args:
             input_file: File to encrypt
             output_file: Encrypted output file
             key: Encryption key
         """
-        try:
-            cmd = [
-                "openssl", "enc", "-aes-256-cbc",
-                "-salt",
-                "-in", str(input_file),
-                "-out", str(output_file),
-                "-k", key
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            if result.returncode != 0:
-                raise SecretsError(f"OpenSSL encryption failed: {result.stderr}")
+        if Cipher is None:
+            self._openssl_cli(["-salt"], input_file, output_file, key, "encryption")
+            return
 
-        except FileNotFoundError:
-            raise SecretsError("OpenSSL not found. Install with: apt install openssl")
-        except subprocess.CalledProcessError as e:
-            raise SecretsError(f"Encryption failed: {e.stderr}") from e
+        try:
+            with open(input_file, 'rb') as src, open(output_file, 'wb') as dst:
+                writer = _EncryptingWriter(dst, key)
+                shutil.copyfileobj(src, writer, _CIPHER_CHUNK_SIZE)
+                writer.finish()
+        except OSError as e:
+            raise SecretsError(f"Encryption failed: {e}") from e
 
     def _decrypt_file(self, input_file: Path, output_file: Path, key: str) -> None:
         """
-        Decrypt file using OpenSSL AES-256-CBC.
+        Decrypt file produced by `_encrypt_file` (or `openssl enc -salt`).
 
         Args:
             input_file: Encrypted file
             output_file: Decrypted output file
             key: Decryption key
         """
+        if Cipher is None:
+            self._openssl_cli(["-d"], input_file, output_file, key, "decryption")
+            return
+
         try:
-            cmd = [
-                "openssl", "enc", "-aes-256-cbc", "-d",
-                "-in", str(input_file),
-                "-out", str(output_file),
-                "-k", key
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            with open(input_file, 'rb') as src, open(output_file, 'wb') as dst:
+                header = src.read(len(_OPENSSL_MAGIC) + _OPENSSL_SALT_LEN)
+                if not header.startswith(_OPENSSL_MAGIC):
+                    raise SecretsError(f"Not an encrypted bundle: {input_file}")
+
+                aes_key, iv = _derive_openssl_key(key, header[len(_OPENSSL_MAGIC):])
+                decryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).decryptor()
+                unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+                while chunk := src.read(_CIPHER_CHUNK_SIZE):
+                    dst.write(unpadder.update(decryptor.update(chunk)))
+                dst.write(unpadder.update(decryptor.finalize()) + unpadder.finalize())
+        except ValueError as e:
+            # Bad padding is the only signal CBC gives for a wrong key
+            raise SecretsError("Decryption failed: bad key or corrupted bundle") from e
+        except OSError as e:
+            raise SecretsError(f"Decryption failed: {e}") from e
+
+    def _openssl_cli(
+        self,
+        extra_args: List[str],
+        input_file: Path,
+        output_file: Path,
+        key: str,
+        operation: str
+    ) -> None:
+        """
+        Run `openssl enc -aes-256-cbc` when cryptography is not installed.
 
-            if result.returncode != 0:
-                raise SecretsError(f"OpenSSL decryption failed: {result.stderr}")
+        Args:
+            extra_args: Mode-specific flags (e.g. ["-d"])
+            input_file: Input file
+            output_file: Output file
+            key: Encryption key
+            operation: Operation name used in error messages
+        """
+        cmd = [
+            _openssl_bin(), "enc", "-aes-256-cbc", *extra_args,
+            "-in", str(input_file),
+            "-out", str(output_file),
+            "-pass", "stdin"
+        ]
 
+        try:
+            subprocess.run(cmd, input=f"{key}\n", capture_output=True, text=True, check=True)
+        except FileNotFoundError:
+            raise SecretsError("OpenSSL not found. Install with: apt install openssl")
         except subprocess.CalledProcessError as e:
-            raise SecretsError(f"Decryption failed: {e.stderr}") from e
+            raise SecretsError(f"{operation.capitalize()} failed: {e.stderr}") from e
 
     def _generate_encryption_key(self) -> str:
         """
@@ -175,26 +222,125 @@ class SecretsManager:
         random_bytes = os.urandom(32)  # 256 bits
         return base64.b64encode(random_bytes).decode('utf-8')
 
+    def encrypt_and_stream_to_vm(
+        self,
+        credentials_dir: Path,
+        vm_host: str,
+        vm_user: str,
+        encryption_key: Optional[str] = None,
+        remote_dir: str = "/tmp"
+    ) -> Tuple[str, str]:
+        """
+        Encrypt credentials and stream the bundle straight to the VM.
+
+        Equivalent to encrypt_credentials() followed by transfer_to_vm(), but
+        the archive goes tar -> cipher -> ssh stdin in one pass, so neither
+        the plaintext tarball nor the encrypted bundle touches local disk.
+
+        Args:
+            credentials_dir: Directory containing credential files
+            vm_host: VM hostname or IP
+            vm_user: SSH username
+            encryption_key: Optional encryption key (auto-generated if not provided)
+            remote_dir: Remote directory for temporary storage
+
+        Returns:
+            Tuple of (remote_bundle_path, encryption_key)
+
+        Raises:
+            SecretsError: If packing, encryption or the transfer fails
+        """
+        utils.log_info(f"📤 Streaming encrypted credentials to {vm_host}...")
+
+        if not credentials_dir.exists():
+            raise SecretsError(f"Credentials directory not found: {credentials_dir}")
+
+        if encryption_key is None:
+            encryption_key = self._generate_encryption_key()
+
+        bundle_name = f"credentials-{utils.get_timestamp()}"
+        remote_temp = f"{remote_dir}/paas-secrets-{self.tenant}"
+        remote_bundle = f"{remote_temp}/{bundle_name}.tar.gz.enc"
+        receive_cmd = (
+            f"umask 077 && mkdir -p {remote_temp} && chmod 700 {remote_temp} && "
+            f"cat > {remote_bundle}"
+        )
+        ssh_cmd = ["ssh", *utils.ssh_base_args(multiplex=True), f"{vm_user}@{vm_host}", receive_cmd]
+
+        receiver = subprocess.Popen(
+            ssh_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        assert receiver.stdin is not None and receiver.stderr is not None
+        try:
+            if Cipher is None:
+                # stdin carries the tar stream, so the key goes in on a
+                # separate pipe (small enough to never block the write)
+                key_read, key_write = os.pipe()
+                os.write(key_write, f"{encryption_key}\n".encode())
+                os.close(key_write)
+                try:
+                    encryptor = subprocess.Popen(
+                        [_openssl_bin(), "enc", "-aes-256-cbc", "-salt", "-pass", f"fd:{key_read}"],
+                        stdin=subprocess.PIPE,
+                        stdout=receiver.stdin,
+                        stderr=subprocess.DEVNULL,
+                        pass_fds=(key_read,),
+                    )
+                finally:
+                    os.close(key_read)
+                with tarfile.open(fileobj=encryptor.stdin, mode='w|gz') as tar:
+                    _add_tree_numeric(tar, credentials_dir, bundle_name)
+                encryptor.stdin.close()
+                if encryptor.wait() != 0:
+                    raise SecretsError(f"OpenSSL encryption failed with exit code {encryptor.returncode}")
+            else:
+                writer = _EncryptingWriter(receiver.stdin, encryption_key)
+                with tarfile.open(fileobj=writer, mode='w|gz') as tar:
+                    _add_tree_numeric(tar, credentials_dir, bundle_name)
+                writer.finish()
+        except SecretsError:
+            receiver.kill()
+            raise
+        except (OSError, tarfile.TarError) as e:
+            receiver.kill()
+            raise SecretsError(f"Failed to stream credentials: {e}") from e
+        finally:
+            try:
+                receiver.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        stderr = receiver.stderr.read().decode(errors="replace")
+        if receiver.wait() != 0:
+            raise SecretsError(f"Failed to transfer credentials: {stderr}")
+
+        utils.log_info(f"✅ Bundle streamed to: {remote_bundle}")
+        return remote_bundle, encryption_key
+
     def transfer_to_vm(
         self,
         encrypted_bundle: Path,
-        encryption_key: str,
         vm_host: str,
         vm_user: str,
         remote_dir: str = "/tmp"
-    ) -> Tuple[str, str]:
+    ) -> str:
         """
         Transfer encrypted credentials to target VM.
 
+        The key never goes to the VM ahead of time; decrypt_and_inject_on_vm
+        hands it to openssl over stdin.
+
         Args:
             encrypted_bundle: Path to encrypted credential bundle
-            encryption_key: Encryption key
             vm_host: VM hostname or IP
             vm_user: SSH username
             remote_dir: Remote directory for temporary storage
 
         Returns:
-            Tuple of (remote_bundle_path, remote_key_path)
+            Path of the bundle on the VM
 
         Raises:
             SecretsError: If transfer fails
@@ -205,25 +351,17 @@ class SecretsManager:
             raise SecretsError(f"Encrypted bundle not found: {encrypted_bundle}")
 
         try:
-            # Create remote temporary directory
+            # Create the private remote temp dir
             remote_temp = f"{remote_dir}/paas-secrets-{self.tenant}"
-            utils.ssh_command(vm_host, vm_user, f"mkdir -p {remote_temp}", check=True)
+            prepare_cmd = f"umask 077 && mkdir -p {remote_temp} && chmod 700 {remote_temp}"
+            utils.ssh_command(vm_host, vm_user, prepare_cmd, check=True)
 
             # Transfer encrypted bundle
             remote_bundle = f"{remote_temp}/{encrypted_bundle.name}"
             utils.scp_upload(vm_host, vm_user, str(encrypted_bundle), remote_bundle)
             utils.log_info(f"✅ Bundle transferred to: {remote_bundle}")
 
-            # Create key file on remote (more secure than transferring)
-            remote_key = f"{remote_temp}/decryption.key"
-            key_cmd = f"echo '{encryption_key}' > {remote_key} && chmod 600 {remote_key}"
-            utils.ssh_command(vm_host, vm_user, key_cmd, check=True)
-            utils.log_info(f"✅ Decryption key created on VM")
-
-            # Secure the remote directory
-            utils.ssh_command(vm_host, vm_user, f"chmod 700 {remote_temp}", check=True)
-
-            return remote_bundle, remote_key
+            return remote_bundle
 
         except Exception as e:
             raise SecretsError(f"Failed to transfer credentials: {e}") from e
@@ -233,17 +371,20 @@ class SecretsManager:
         vm_host: str,
         vm_user: str,
         remote_bundle: str,
-        remote_key: str,
+        encryption_key: str,
         target_dir: str = "~/paas-deployment"
     ) -> bool:
         """
         Decrypt credentials on VM and inject into deployment directory.
 
+        The key is written to the session's stdin and read by openssl via
+        `-pass stdin`, so it never lands on the VM's disk or in a process argv.
+
         Args:
             vm_host: VM hostname or IP
             vm_user: SSH username
             remote_bundle: Path to encrypted bundle on VM
-            remote_key: Path to decryption key on VM
+            encryption_key: Bundle encryption key
             target_dir: Target directory for decrypted credentials
 
         Returns:
@@ -255,42 +396,30 @@ class SecretsManager:
         utils.log_info(f"🔓 Decrypting and injecting credentials on VM...")
 
         try:
-            # Decrypt on remote
+            # Decrypt, extract and install in a single SSH session; the
+            # script echoes the extracted directory as its last line
             decrypted_archive = remote_bundle.replace('.enc', '')
-            decrypt_cmd = f"openssl enc -aes-256-cbc -d -in {remote_bundle} -out {decrypted_archive} -k $(cat {remote_key})"
-
-            result = utils.ssh_command(vm_host, vm_user, decrypt_cmd, check=False)
-
-            if result.returncode != 0:
-                raise SecretsError(f"Remote decryption failed: {result.stderr}")
-
-            utils.log_info("✅ Credentials decrypted on VM")
-
-            # Extract archive
             remote_temp_dir = str(Path(remote_bundle).parent)
-            extract_cmd = f"cd {remote_temp_dir} && tar -xzf {decrypted_archive}"
-            utils.ssh_command(vm_host, vm_user, extract_cmd, check=True)
-
-            # Find extracted directory
-            ls_cmd = f"ls -d {remote_temp_dir}/credentials-*/ | head -1"
-            result = utils.ssh_command(vm_host, vm_user, ls_cmd, check=False)
+            inject_script = f"""set -e
+openssl enc -aes-256-cbc -d -pass stdin -in {remote_bundle} -out {decrypted_archive}
+cd {remote_temp_dir}
+tar -xzf {decrypted_archive}
+extracted=$(ls -d {remote_temp_dir}/credentials-*/ | head -1)
+[ -n "$extracted" ]
+mkdir -p {target_dir}
+cp -r "$extracted"*.env {target_dir}/ || true
+chmod 600 {target_dir}/*.env
+echo "$extracted"
+"""
+            result = utils.ssh_command(
+                vm_host, vm_user, inject_script, check=False, input_text=f"{encryption_key}\n"
+            )
 
             if result.returncode != 0:
-                raise SecretsError("Could not find extracted credentials directory")
-
-            extracted_dir = result.stdout.strip()
-
-            # Create target directory
-            utils.ssh_command(vm_host, vm_user, f"mkdir -p {target_dir}", check=True)
-
-            # Copy credential files to target
-            copy_cmd = f"cp -r {extracted_dir}/*.env {target_dir}/ || true"
-            utils.ssh_command(vm_host, vm_user, copy_cmd, check=True)
-
-            # Set restrictive permissions
-            chmod_cmd = f"chmod 600 {target_dir}/*.env"
-            utils.ssh_command(vm_host, vm_user, chmod_cmd, check=True)
+                raise SecretsError(f"Remote injection failed: {result.stderr or result.stdout}")
 
+            extracted_dir = result.stdout.strip().splitlines()[-1]
+            utils.log_info(f"✅ Credentials decrypted on VM: {extracted_dir}")
             utils.log_success(f"✅ Credentials injected to: {target_dir}")
 
             # Cleanup temporary files
@@ -313,14 +442,12 @@ class SecretsManager:
         utils.log_info("🧹 Cleaning up temporary credential files...")
 
         try:
-            # Securely overwrite files before deletion
+            # Overwrite every file once and unlink it (including the
+            # extracted plaintext), a few shred processes in parallel
             cleanup_script = f"""
-cd {remote_dir} || exit 0
-for file in *.enc *.tar.gz *.key; do
-    [ -f "$file" ] && shred -vfz -n 3 "$file" || true
-done
-cd ..
-rm -rf {remote_dir}
+cd {remote_dir} 2>/dev/null || exit 0
+find . -type f -print0 | xargs -0 -r -P4 shred -n 1 -u -f
+cd / && rm -rf {remote_dir}
 """
             utils.ssh_command(vm_host, vm_user, cleanup_script, check=False)
             utils.log_info("✅ Temporary files securely removed")
@@ -384,27 +511,31 @@ rm -rf {remote_dir}
             f"{target_dir}/credentials.env"
         ]
 
-        all_present = True
-
-        for file_path in expected_files:
-            check_cmd = f"test -f {file_path} && echo 'exists' || echo 'missing'"
-            result = utils.ssh_command(vm_host, vm_user, check_cmd, check=False)
+        # One line per file, in order: its size or "missing". A loop rather
+        # than one multi-file stat, because stat reports missing files on
+        # stderr, which cannot be lined up with stdout; it also keeps the
+        # regular-file (-f) semantics and lets the shell expand ~.
+        check_cmd = (
+            f"for f in {' '.join(expected_files)}; do "
+            f"if [ -f \"$f\" ]; then stat -c %s \"$f\"; else echo missing; fi; done"
+        )
+        result = utils.ssh_command(vm_host, vm_user, check_cmd, check=False)
+        if result.returncode != 0:
+            utils.log_warn(f"⚠️  Could not check credential files on {vm_host}: {(result.stderr or '').strip()}")
+            return False
+        sizes = result.stdout.split()
 
-            if "exists" in result.stdout:
-                # Check file is not empty
-                size_cmd = f"stat -c %s {file_path}"
-                size_result = utils.ssh_command(vm_host, vm_user, size_cmd, check=False)
+        all_present = len(sizes) == len(expected_files)
 
-                if size_result.returncode == 0:
-                    size = int(size_result.stdout.strip())
-                    if size > 0:
-                        utils.log_info(f"✅ {file_path} ({size} bytes)")
-                    else:
-                        utils.log_warn(f"⚠️  {file_path} is empty")
-                        all_present = False
-            else:
+        for file_path, size in zip(expected_files, sizes):
+            if size == "missing":
                 utils.log_warn(f"❌ {file_path} not found")
                 all_present = False
+            elif int(size) > 0:
+                utils.log_info(f"✅ {file_path} ({size} bytes)")
+            else:
+                utils.log_warn(f"⚠️  {file_path} is empty")
+                all_present = False
 
         if all_present:
             utils.log_success("✅ All credential files validated")
@@ -426,20 +557,171 @@ rm -rf {remote_dir}
         if not env_file.exists():
             return ""
 
-        hasher = hashlib.sha256()
-
         with open(env_file, 'rb') as f:
-            hasher.update(f.read())
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            hasher = hashlib.sha256()
+            while chunk := f.read(_CIPHER_CHUNK_SIZE):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+    def compute_source_hash(self, credentials_dir: Path) -> str:
+        """
+        Compute one hash over every file in a credentials directory.
+
+        Combines sorted (relative path, file hash) pairs, so renames,
+        additions and removals all change the result.
+
+        Args:
+            credentials_dir: Directory containing credential files
 
+        Returns:
+            SHA256 hex digest, or "" if the directory does not exist
+        """
+        if not credentials_dir.is_dir():
+            return ""
+
+        hasher = hashlib.sha256()
+        for path in sorted(p for p in credentials_dir.rglob('*') if p.is_file()):
+            rel = path.relative_to(credentials_dir).as_posix()
+            hasher.update(f"{rel}\0{self.compute_env_hash(path)}\n".encode())
         return hasher.hexdigest()
 
+    def is_deployed(self, vm_host: str, source_hash: str, target_dir: str) -> bool:
+        """
+        Check whether source_hash was the last successful deployment to vm_host/target_dir.
+
+        Args:
+            vm_host: VM hostname or IP
+            source_hash: Hash from compute_source_hash()
+            target_dir: Target directory on the VM
+
+        Returns:
+            True if the recorded deployment matches
+        """
+        entry = self._load_deploy_state().get(vm_host) or {}
+        return bool(source_hash) and entry.get("hash") == source_hash and entry.get("target_dir") == target_dir
+
+    def record_deployment(self, vm_host: str, source_hash: str, target_dir: str) -> None:
+        """
+        Remember a successful deployment in secrets_dir/.deploy_state.json.
+
+        Args:
+            vm_host: VM hostname or IP
+            source_hash: Hash from compute_source_hash()
+            target_dir: Target directory on the VM
+        """
+        with _DEPLOY_STATE_LOCK:
+            state = self._load_deploy_state()
+            state[vm_host] = {"hash": source_hash, "target_dir": target_dir, "ts": time.time()}
+            state_file = self.secrets_dir / _DEPLOY_STATE_FILE
+            tmp_file = state_file.with_suffix('.tmp')
+            try:
+                tmp_file.write_text(json.dumps(state, indent=2))
+                os.replace(tmp_file, state_file)
+            except OSError as e:
+                utils.log_warn(f"Could not record deployment state: {e}")
+
+    def _load_deploy_state(self) -> Dict[str, Dict]:
+        """Load secrets_dir/.deploy_state.json, treating a missing or corrupt file as empty."""
+        try:
+            return json.loads((self.secrets_dir / _DEPLOY_STATE_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _openssl_bin() -> str:
+    """Resolve the openssl executable once per process (falls back to a PATH lookup at exec time)."""
+    return shutil.which("openssl") or "openssl"
+
+
+def _derive_openssl_key(password: str, salt: bytes) -> Tuple[bytes, bytes]:
+    """
+    Derive AES-256 key and IV the way `openssl enc -k` does (EVP_BytesToKey, SHA-256).
+
+    Args:
+        password: Passphrase given to openssl
+        salt: 8-byte salt from the bundle header
+
+    Returns:
+        Tuple of (key, iv)
+    """
+    material = b""
+    block = b""
+    secret = password.encode('utf-8')
+    while len(material) < 48:
+        block = hashlib.sha256(block + secret + salt).digest()
+        material += block
+    return material[:32], material[32:48]
+
+
+def _add_tree_numeric(tar: tarfile.TarFile, root: Path, arcname: str) -> None:
+    """
+    Add a directory tree like tar.add(), storing every member as 0:0 with no owner names.
+
+    tar.add() resolves uname/gname through pwd/grp for every member; the
+    remote side extracts as an unprivileged user and ignores ownership, so
+    the lookups (and the local account names they leak) are skipped.
+
+    Args:
+        tar: Archive opened for writing
+        root: Directory to add
+        arcname: Name of the top-level directory inside the archive
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, root)
+        base = arcname if rel == "." else f"{arcname}/{rel}"
+        tar.addfile(_numeric_tarinfo(base, os.stat(dirpath)))
+
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            with open(path, 'rb') as f:
+                info = _numeric_tarinfo(f"{base}/{name}", os.fstat(f.fileno()))
+                tar.addfile(info, f)
+
+
+def _numeric_tarinfo(name: str, st: os.stat_result) -> tarfile.TarInfo:
+    """Build a TarInfo from a stat result, leaving uid/gid at 0 and names empty."""
+    info = tarfile.TarInfo(name)
+    info.mode = stat.S_IMODE(st.st_mode)
+    info.mtime = int(st.st_mtime)
+    if stat.S_ISDIR(st.st_mode):
+        info.type = tarfile.DIRTYPE
+    else:
+        info.size = st.st_size
+    return info
+
+
+class _EncryptingWriter:
+    """Write-only file object encrypting into `dst` in the `openssl enc -salt` format."""
+
+    def __init__(self, dst: BinaryIO, key: str):
+        salt = os.urandom(_OPENSSL_SALT_LEN)
+        aes_key, iv = _derive_openssl_key(key, salt)
+        self._dst = dst
+        self._encryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).encryptor()
+        self._padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        dst.write(_OPENSSL_MAGIC + salt)
+
+    def write(self, data: bytes) -> int:
+        self._dst.write(self._encryptor.update(self._padder.update(data)))
+        return len(data)
+
+    def finish(self) -> None:
+        """Flush the final padded block; the writer must not be used afterwards."""
+        self._dst.write(self._encryptor.update(self._padder.finalize()) + self._encryptor.finalize())
+
 
 def deploy_secrets_to_vm(
     tenant: str,
     credentials_dir: Path,
     vm_host: str,
     vm_user: str,
-    target_dir: str = "~/paas-deployment"
+    target_dir: str = "~/paas-deployment",
+    fast_deploy: bool = True
 ) -> bool:
     """
     Complete workflow: encrypt, transfer, and inject credentials to VM.
@@ -450,44 +732,183 @@ def deploy_secrets_to_vm(
         vm_host: VM hostname or IP
         vm_user: SSH username
         target_dir: Target directory on VM
+        fast_deploy: If True, skip the transfer when these exact credentials
+            were already deployed to this VM and the files still validate
 
     Returns:
         True if successful
     """
     secrets_mgr = SecretsManager(tenant)
+    source_hash = secrets_mgr.compute_source_hash(credentials_dir)
 
-    try:
-        # Step 1: Encrypt credentials
-        encrypted_bundle = secrets_mgr.encrypt_credentials(credentials_dir)
-
-        # Step 2: Get encryption key
-        key_file = encrypted_bundle.with_suffix('.key')
-        with open(key_file, 'r') as f:
-            encryption_key = f.read().strip()
+    if fast_deploy and _is_current(secrets_mgr, source_hash, vm_host, vm_user, target_dir):
+        return True
 
-        # Step 3: Transfer to VM
-        remote_bundle, remote_key = secrets_mgr.transfer_to_vm(
-            encrypted_bundle,
-            encryption_key,
+    try:
+        # Step 1: Encrypt credentials and stream them to the VM
+        remote_bundle, encryption_key = secrets_mgr.encrypt_and_stream_to_vm(
+            credentials_dir,
             vm_host,
             vm_user
         )
 
-        # Step 4: Decrypt and inject on VM
+        # Step 2: Decrypt and inject on VM
         success = secrets_mgr.decrypt_and_inject_on_vm(
             vm_host,
             vm_user,
             remote_bundle,
-            remote_key,
+            encryption_key,
             target_dir
         )
 
-        # Step 5: Validate injection
-        if success:
-            secrets_mgr.validate_credential_injection(vm_host, vm_user, target_dir)
+        # Step 3: Validate injection
+        if success and secrets_mgr.validate_credential_injection(vm_host, vm_user, target_dir):
+            secrets_mgr.record_deployment(vm_host, source_hash, target_dir)
 
         return success
 
     except SecretsError as e:
         utils.log_error(f"Secret deployment failed: {e}")
         return False
+
+
+def _is_current(
+    secrets_mgr: SecretsManager,
+    source_hash: str,
+    vm_host: str,
+    vm_user: str,
+    target_dir: str
+) -> bool:
+    """
+    Check whether source_hash is already deployed to a VM and still validates.
+
+    Returns:
+        True if the deployment can be skipped
+    """
+    if not secrets_mgr.is_deployed(vm_host, source_hash, target_dir):
+        return False
+    utils.log_info(f"⏩ Credentials unchanged since last deployment to {vm_host}")
+    if secrets_mgr.validate_credential_injection(vm_host, vm_user, target_dir):
+        return True
+    utils.log_info(f"   Validation failed on {vm_host}, redeploying")
+    return False
+
+
+def _deploy_bundle_to_vm(
+    secrets_mgr: SecretsManager,
+    encrypted_bundle: Path,
+    encryption_key: str,
+    source_hash: str,
+    vm_host: str,
+    vm_user: str,
+    target_dir: str
+) -> bool:
+    """
+    Transfer, inject and validate an already encrypted bundle on one VM.
+
+    A deployment that validates is recorded under source_hash.
+
+    Returns:
+        True if successful
+    """
+    try:
+        remote_bundle = secrets_mgr.transfer_to_vm(
+            encrypted_bundle,
+            vm_host,
+            vm_user
+        )
+        success = secrets_mgr.decrypt_and_inject_on_vm(
+            vm_host,
+            vm_user,
+            remote_bundle,
+            encryption_key,
+            target_dir
+        )
+        if success and secrets_mgr.validate_credential_injection(vm_host, vm_user, target_dir):
+            secrets_mgr.record_deployment(vm_host, source_hash, target_dir)
+        return success
+
+    except SecretsError as e:
+        utils.log_error(f"Secret deployment to {vm_host} failed: {e}")
+        return False
+
+
+def deploy_secrets_to_vms(
+    tenant: str,
+    credentials_dir: Path,
+    targets: List[Tuple[str, str]],
+    target_dir: str = "~/paas-deployment",
+    max_workers: Optional[int] = None,
+    fast_deploy: bool = True
+) -> Dict[Tuple[str, str], bool]:
+    """
+    Deploy the same credentials to several VMs concurrently.
+
+    The bundle is encrypted once; each VM then gets the same ciphertext
+    through its own transfer/inject/validate sequence on a worker thread.
+    Deployments share the deploy state of deploy_secrets_to_vm(), so VMs
+    already holding these credentials are skipped either way.
+
+    Args:
+        tenant: Tenant name
+        credentials_dir: Directory containing generated credentials
+        targets: List of (vm_host, vm_user) pairs
+        target_dir: Target directory on each VM
+        max_workers: Thread count (defaults to min(16, len(targets)))
+        fast_deploy: If True, skip VMs that already hold these exact
+            credentials and still validate
+
+    Returns:
+        Mapping of (vm_host, vm_user) target to success flag
+    """
+    if not targets:
+        return {}
+
+    secrets_mgr = SecretsManager(tenant)
+    source_hash = secrets_mgr.compute_source_hash(credentials_dir)
+    workers = max_workers or min(16, len(targets))
+    results: Dict[Tuple[str, str], bool] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = targets
+        if fast_deploy:
+            futures = {
+                executor.submit(_is_current, secrets_mgr, source_hash, vm_host, vm_user, target_dir): (vm_host, vm_user)
+                for vm_host, vm_user in targets
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    results[futures[future]] = True
+            pending = [t for t in targets if t not in results]
+
+        if pending:
+            try:
+                encrypted_bundle, encryption_key = secrets_mgr.encrypt_credentials(credentials_dir)
+            except SecretsError as e:
+                utils.log_error(f"Secret deployment failed: {e}")
+                return {**results, **{target: False for target in pending}}
+
+            utils.log_info(f"🚀 Deploying secrets to {len(pending)} VM(s) with {workers} worker(s)")
+            futures = {
+                executor.submit(
+                    _deploy_bundle_to_vm,
+                    secrets_mgr,
+                    encrypted_bundle,
+                    encryption_key,
+                    source_hash,
+                    vm_host,
+                    vm_user,
+                    target_dir
+                ): (vm_host, vm_user)
+                for vm_host, vm_user in pending
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    failed = sorted(f"{user}@{host}" for (host, user), ok in results.items() if not ok)
+    if failed:
+        utils.log_warn(f"⚠️  Secret deployment failed on: {', '.join(failed)}")
+    else:
+        utils.log_success(f"✅ Secrets deployed to all {len(results)} VM(s)")
+
+    return results
@@ -15,6 +15,9 @@ from typing import Dict, Any, Optional
 from . import constants
 from . import utils
 
+# libyaml-backed emitter when PyYAML was built with it; output is identical
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def generate_traefik_dynamic_config(
     general_config: Dict[str, Any],
@@ -49,38 +52,44 @@ def generate_traefik_dynamic_config(
 
     # Define MUST-HAVE services even if not explicitly in selection.yml
     # (assuming they are always deployed in core step)
-    core_services = ["vaultwarden", "homepage", "tailscale"]  # Add others if needed
+    core_services = frozenset({"vaultwarden", "homepage", "tailscale"})  # Add others if needed
+
+    routers = traefik_config["http"]["routers"]
+    services = traefik_config["http"]["services"]
+    get_port = constants.SERVICE_PORT_MAPPINGS.get
+    get_custom_host = service_domains.get
 
     for svc_id, svc_config in selected_services.items():
-        if svc_config.get("enabled", False) or svc_id in core_services:
-            # Basic assumption: service name in compose matches svc_id
-            # and exposes a standard port (e.g., 80, 8080, 3000)
-            # This needs refinement based on actual compose definitions
-            service_port = constants.SERVICE_PORT_MAPPINGS.get(svc_id, "80")
-
-            router_name = f"{svc_id}-router"
-            service_name = f"{svc_id}-service"
-            custom_host = service_domains.get(svc_id)
-            if custom_host:
-                host_rule = f"Host(`{custom_host}`)"
-            else:
-                host_rule = f"Host(`{svc_id}.{domain}`)"
-
-            traefik_config["http"]["routers"][router_name] = {
-                "rule": host_rule,
-                "service": service_name,
-                "entryPoints": ["web"],
-            }
-            traefik_config["http"]["services"][service_name] = {
-                "loadBalancer": {
-                    "servers": [{"url": f"http://{svc_id}:{service_port}"}]  # Assumes service name is DNS resolvable
-                }
+        if not (svc_config.get("enabled", False) or svc_id in core_services):
+            continue
+
+        # Basic assumption: service name in compose matches svc_id
+        # and exposes a standard port (e.g., 80, 8080, 3000)
+        # This needs refinement based on actual compose definitions
+        service_port = get_port(svc_id, "80")
+
+        service_name = f"{svc_id}-service"
+        custom_host = get_custom_host(svc_id)
+        if custom_host:
+            host_rule = f"Host(`{custom_host}`)"
+        else:
+            host_rule = f"Host(`{svc_id}.{domain}`)"
+
+        routers[f"{svc_id}-router"] = {
+            "rule": host_rule,
+            "service": service_name,
+            "entryPoints": ["web"],
+        }
+        services[service_name] = {
+            "loadBalancer": {
+                "servers": [{"url": f"http://{svc_id}:{service_port}"}]  # Assumes service name is DNS resolvable
             }
-            print(f"  + Added route for {svc_id}.{domain}")
+        }
+        print(f"  + Added route for {svc_id}.{domain}")
 
     try:
         with open(config_path, 'w') as f:
-            yaml.dump(traefik_config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(traefik_config, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
         print(f"✅ Traefik dynamic config generated at {config_path}")
         return config_path
     except IOError as e:
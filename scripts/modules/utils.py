@@ -8,7 +8,13 @@ This module provides helper functions for:
 - IP/CIDR parsing
 """
 
+import asyncio
+import collections
+import copy
+import functools
 import os
+import re
+import socket
 import subprocess
 import sys
 import time
@@ -108,6 +114,59 @@ def ssh_identity_args() -> list[str]:
     return ["-i", str(identity)] if identity else []
 
 
+# Static '-o' option blocks, built once at import; only the identity,
+# connect timeout and the PAAS_SSH_MUX switch vary per call.
+_SSH_MULTIPLEX_OPTS = (
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={constants.SSH_CONTROL_PATH}",
+    "-o", f"ControlPersist={constants.SSH_CONTROL_PERSIST}",
+)
+_SSH_HOST_KEY_OPTS = (
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "UserKnownHostsFile=/dev/null",
+)
+_SSH_SESSION_OPTS = (
+    "-o", "BatchMode=yes",
+    *_SSH_HOST_KEY_OPTS,
+    "-o", f"ServerAliveInterval={constants.SSH_SERVER_ALIVE_INTERVAL}",
+    "-o", f"ServerAliveCountMax={constants.SSH_SERVER_ALIVE_COUNT_MAX}",
+)
+_SCP_TRANSFER_OPTS = (
+    *_SSH_HOST_KEY_OPTS,
+    "-o", "IPQoS=throughput",
+    "-o", "Compression=no",
+    "-o", f"Ciphers={constants.SCP_CIPHERS}",
+)
+
+
+def ssh_multiplex_enabled() -> bool:
+    """
+    Return False when connection sharing is disabled via PAAS_SSH_MUX=0.
+    """
+    raw = os.environ.get(constants.ENV_SSH_MUX, "1").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def ssh_multiplex_args() -> list[str]:
+    """
+    Return ssh/scp '-o' options that share one connection per host.
+
+    With ControlMaster=auto the first session becomes the master and later
+    sessions to the same user@host:port reuse it, skipping the TCP and key
+    exchange handshake. Returns [] when PAAS_SSH_MUX disables sharing.
+    """
+    if not ssh_multiplex_enabled():
+        return []
+    _ensure_ssh_control_dir()
+    return list(_SSH_MULTIPLEX_OPTS)
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_ssh_control_dir() -> None:
+    """Create the ControlPath directory once per process."""
+    constants.SSH_CONTROL_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+
 def ensure_tenant_ssh_identity(tenant_name: str) -> Path:
     """
     Ensure the ms-config tenant directory contains an ed25519 keypair.
@@ -155,6 +214,48 @@ class DebugContext:
         return cls._debug
 
 
+_STREAM_CHUNK_SIZE = 1 << 16  # one pipe buffer per read
+
+
+def _drain_output(proc: subprocess.Popen, echo: bool) -> str:
+    """
+    Read a child's binary stdout pipe to EOF in large chunks.
+
+    Chunks are optionally echoed to our stdout as they arrive and decoded
+    once at the end, instead of one read/print round trip per line.
+
+    Args:
+        proc: Process started with stdout=PIPE in binary mode
+        echo: If True, mirror output to sys.stdout in real time
+
+    Returns:
+        Decoded output with newlines normalised like text-mode pipes
+    """
+    assert proc.stdout is not None
+    collected: list[bytes] = []
+    # Raw chunks go straight to the byte stream; fall back to text writes
+    # when stdout has been replaced by something without a buffer.
+    sink = getattr(sys.stdout, "buffer", None) if echo else None
+    if sink is not None:
+        sys.stdout.flush()
+
+    # Bound methods hoisted out of the loop
+    read, append = os.read, collected.append
+    try:
+        fd = proc.stdout.fileno()
+        while chunk := read(fd, _STREAM_CHUNK_SIZE):
+            append(chunk)
+            if sink is not None:
+                sink.write(chunk)
+                sink.flush()
+            elif echo:
+                print(chunk.decode(errors="replace"), end="", flush=True)
+    finally:
+        proc.stdout.close()
+
+    return b"".join(collected).decode(errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
 def run_command(
     command: list[str],
     cwd: Path,
@@ -181,13 +282,11 @@ def run_command(
     if not command:
         raise ValueError("run_command requires a non-empty command list")
 
-    cmd_str = " ".join(command)
     label = label or Path(command[0]).name
-    log_cmd(f"{cmd_str} (cwd={cwd})")
+    log_cmd(f"{' '.join(command)} (cwd={cwd})")
 
-    process_env = os.environ.copy()
-    if env:
-        process_env.update(env)
+    # None lets the child inherit our environment without copying it
+    process_env = {**os.environ, **env} if env else None
 
     try:
         proc = subprocess.Popen(
@@ -196,27 +295,13 @@ def run_command(
             env=process_env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
         )
     except FileNotFoundError:
         log_error(f"Command not found: {command[0]}")
         sys.exit(1)
 
-    assert proc.stdout is not None
-    collected: list[str] = []
-    should_stream = stream_output or DebugContext.is_debug()
-
-    try:
-        for line in proc.stdout:
-            collected.append(line)
-            if should_stream:
-                print(line, end="")
-    finally:
-        proc.stdout.close()
-
+    output = _drain_output(proc, stream_output or DebugContext.is_debug())
     rc = proc.wait()
-    output = "".join(collected)
     result = subprocess.CompletedProcess(command, rc, stdout=output)
 
     if rc == 0:
@@ -229,6 +314,10 @@ def run_command(
     return result
 
 
+# `[export ]NAME=value`; raw tokens (user@realm!id=secret) never start with an identifier followed by '='
+_ENV_ASSIGNMENT_RE = re.compile(r"^(?:(?i:export)\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=(.*)$")
+
+
 def load_proxmox_api_token() -> str:
     """
     Load the Proxmox API token from environment or proxmox_api.txt.
@@ -248,7 +337,7 @@ def load_proxmox_api_token() -> str:
     """
     token = os.environ.get(constants.ENV_PROXMOX_API_TOKEN)
     if token:
-        return token.strip().strip('"').strip("'").strip()
+        return token.strip().strip('\'"').strip()
 
     token_file = constants.PROXMOX_API_TOKEN_FILE
     if token_file.exists():
@@ -259,18 +348,15 @@ def load_proxmox_api_token() -> str:
                     if not line or line.startswith('#'):
                         continue
                     # Handle export/assignment formats
-                    if constants.ENV_PROXMOX_API_TOKEN in line and "=" in line:
-                        # remove optional 'export ' prefix
-                        if line.lower().startswith("export "):
-                            line = line[7:].strip()
-                        # split key/value
-                        key, val = line.split("=", 1)
-                        if key.strip() == constants.ENV_PROXMOX_API_TOKEN:
-                            val = val.strip().strip('"').strip("'")
+                    match = _ENV_ASSIGNMENT_RE.match(line)
+                    if match:
+                        if match.group(1) == constants.ENV_PROXMOX_API_TOKEN:
+                            val = match.group(2).strip().strip('\'"')
                             if val:
                                 return val
-                    # Fallback: treat the line itself as the token
-                    return line.strip().strip('"').strip("'")
+                        continue
+                    # Fallback: a line that is not an assignment is the raw token
+                    return line.strip('\'"')
         except IOError as e:
             print(f"❌ Error reading token file {token_file}: {e}")
             sys.exit(1)
@@ -289,7 +375,12 @@ def wait_for_ssh(
     """
     Wait until SSH is reachable on host for user within timeout.
 
-    Uses a simple 'ssh -o BatchMode=yes -o ConnectTimeout=5 user@host true'.
+    Polls the SSH port with a plain TCP connect (checking for the sshd
+    banner) and only runs 'ssh -o BatchMode=yes user@host true' once it
+    answers, so attempts against a booting VM cost a socket instead of an
+    ssh process.
+    The successful ssh leaves a shared master connection behind for the
+    commands that follow.
 
     Args:
         host: Target hostname or IP address
@@ -302,40 +393,64 @@ def wait_for_ssh(
     """
     print(f"⏳ Waiting for SSH on {user}@{host} (timeout {timeout_sec}s)...")
     start = time.time()
+    cmd = ["ssh", *ssh_base_args(multiplex=True), f"{user}@{host}", "true"]
     while time.time() - start < timeout_sec:
-        try:
-            cmd = [
-                "ssh",
-                *ssh_identity_args(),
-                "-o", "BatchMode=yes",
-                "-o", "StrictHostKeyChecking=no",
-                "-o", "UserKnownHostsFile=/dev/null",
-                "-o", f"ConnectTimeout={constants.SSH_CONNECT_TIMEOUT}",
-                f"{user}@{host}",
-                "true",
-            ]
-            run_command(cmd, cwd=constants.ROOT_DIR, check=True)
-            print("✅ SSH is available.")
-            return True
-        except Exception:
-            remaining = int(timeout_sec - (time.time() - start))
-            print(f"... SSH not ready yet, retrying in {interval_sec}s (remaining ~{remaining}s)")
-            time.sleep(interval_sec)
+        if _ssh_banner_ready(host, constants.SSH_PORT, constants.SSH_CONNECT_TIMEOUT):
+            log_cmd(" ".join(cmd))
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+            if result.returncode == 0:
+                print("✅ SSH is available.")
+                return True
+            if DebugContext.is_debug():
+                print(result.stderr, end="")
+        remaining = int(timeout_sec - (time.time() - start))
+        print(f"... SSH not ready yet, retrying in {interval_sec}s (remaining ~{remaining}s)")
+        time.sleep(interval_sec)
     print("❌ Timed out waiting for SSH.")
     return False
 
 
+def _ssh_banner_ready(host: str, port: int, timeout: float) -> bool:
+    """
+    Return True if host:port accepts a TCP connection and greets with an SSH banner.
+
+    Reading the 'SSH-2.0-...' identification line tells a running sshd
+    apart from a port that merely accepts connections (socket activation,
+    a proxy, or sshd still starting up and resetting connections).
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            return sock.recv(64).startswith(b"SSH-")
+    except OSError:
+        return False
+
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_install_config(cfg_path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse install_config.yaml; cached per (path, mtime, size) so edits invalidate it."""
+    with open(cfg_path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 def read_install_config() -> dict:
     """
     Load OS_install/configs/install_config.yaml as a dict.
 
+    The parse is cached until the file's mtime or size changes; each call
+    returns its own deep copy, so callers may modify it freely. Call
+    clear_install_config_cache() to force a re-parse.
+
     Returns:
         Dictionary containing install configuration, or empty dict on error
     """
     cfg_path = constants.OS_INSTALL_CONFIG
     try:
-        with open(cfg_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        st = os.stat(cfg_path)
+        return copy.deepcopy(_load_install_config(cfg_path, st.st_mtime_ns, st.st_size))
     except Exception as e:
         print(f"❌ Unable to read install config at {cfg_path}: {e}")
         return {}
@@ -353,7 +468,7 @@ def ip_from_cidr(cidr: str) -> str:
     """
     if not isinstance(cidr, str):
         return ""
-    return cidr.split('/')[0].strip()
+    return cidr.partition('/')[0].strip()
 
 
 def get_vm_connection_info(vm_name: str) -> tuple[str, dict]:
@@ -361,7 +476,8 @@ def get_vm_connection_info(vm_name: str) -> tuple[str, dict]:
     Return (host_or_ip, vm_cfg) from install_config for vm_name.
 
     Prefers network.address_cidr IP; falls back to network.hostname;
-    last resort returns vm_name.
+    last resort returns vm_name. Results are memoized per VM until
+    install_config.yaml changes; vm_cfg is returned as a fresh copy.
 
     Args:
         vm_name: Name of the VM in install_config.yaml
@@ -369,6 +485,27 @@ def get_vm_connection_info(vm_name: str) -> tuple[str, dict]:
     Returns:
         Tuple of (connection_string, vm_config_dict)
     """
+    try:
+        st = os.stat(constants.OS_INSTALL_CONFIG)
+    except OSError:
+        return _resolve_vm_connection_info(vm_name)
+    host_or_ip, vm_cfg = _cached_vm_connection_info(vm_name, st.st_mtime_ns, st.st_size)
+    return host_or_ip, copy.deepcopy(vm_cfg)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_vm_connection_info(vm_name: str, mtime_ns: int, size: int) -> tuple[str, dict]:
+    """get_vm_connection_info() keyed on the install_config stamp."""
+    return _resolve_vm_connection_info(vm_name)
+
+
+def clear_install_config_cache() -> None:
+    """Drop the parsed install_config and the VM lookups derived from it."""
+    _load_install_config.cache_clear()
+    _cached_vm_connection_info.cache_clear()
+
+
+def _resolve_vm_connection_info(vm_name: str) -> tuple[str, dict]:
     cfg = read_install_config()
     installs = cfg.get("installs", {})
     vm_cfg = installs.get(vm_name, {}) if isinstance(installs, dict) else {}
@@ -385,6 +522,10 @@ def get_vm_connection_info(vm_name: str) -> tuple[str, dict]:
     return host_or_ip, vm_cfg
 
 
+# Backslash and double quote are the only characters escaped inside "..." here
+_NIX_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def nix_escape_string(s: str) -> str:
     """
     Escape a string for safe inclusion in Nix expressions.
@@ -395,8 +536,59 @@ def nix_escape_string(s: str) -> str:
     Returns:
         Escaped string safe for Nix
     """
-    s = s or ""
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return (s or "").translate(_NIX_ESCAPE_TABLE)
+
+
+def ssh_base_args(
+    connect_timeout: Optional[int] = None,
+    multiplex: bool = False
+) -> list[str]:
+    """
+    Return the ssh options every outbound SSH session uses.
+
+    BatchMode keeps a stalled authentication from waiting on a password
+    prompt, and the keepalive options bound how long a dead session can hang.
+    With multiplex=True the session joins (or opens) the shared master
+    connection for user@host.
+
+    Args:
+        connect_timeout: SSH connect timeout in seconds (defaults to constants.SSH_CONNECT_TIMEOUT)
+        multiplex: If True, add the ControlMaster options
+    """
+    timeout = connect_timeout or constants.SSH_CONNECT_TIMEOUT
+    return [
+        *ssh_identity_args(),
+        *(ssh_multiplex_args() if multiplex else ()),
+        *_SSH_SESSION_OPTS,
+        "-o", f"ConnectTimeout={timeout}",
+    ]
+
+
+def scp_base_args() -> list[str]:
+    """
+    Return the scp options shared by uploads and downloads.
+
+    Transfers are tuned for throughput: payloads are already compressed
+    tarballs (so ssh compression only burns CPU), IPQoS marks the flow as
+    bulk, and the cipher list prefers AES-GCM, which runs on AES-NI.
+    """
+    return [*ssh_identity_args(), *ssh_multiplex_args(), *_SCP_TRANSFER_OPTS]
+
+
+def _ssh_argv(
+    host: str,
+    user: str,
+    command: str,
+    connect_timeout: Optional[int] = None,
+    multiplex: bool = False
+) -> list[str]:
+    """Build the ssh argument vector shared by the sync and async runners."""
+    return [
+        "ssh",
+        *ssh_base_args(connect_timeout, multiplex),
+        f"{user}@{host}",
+        command
+    ]
 
 
 def ssh_command(
@@ -404,7 +596,9 @@ def ssh_command(
     user: str,
     command: str,
     check: bool = True,
-    stream_output: bool = False
+    stream_output: bool = False,
+    connect_timeout: Optional[int] = None,
+    input_text: Optional[str] = None
 ) -> subprocess.CompletedProcess:
     """
     Execute a command on a remote host via SSH.
@@ -415,6 +609,8 @@ def ssh_command(
         command: Command to execute on remote host
         check: If True, raise exception on non-zero exit code
         stream_output: If True, stream output in real-time
+        connect_timeout: SSH connect timeout in seconds (defaults to constants.SSH_CONNECT_TIMEOUT)
+        input_text: Optional data fed to the remote command's stdin (keeps secrets out of argv)
 
     Returns:
         CompletedProcess instance with command results
@@ -422,36 +618,26 @@ def ssh_command(
     Raises:
         subprocess.CalledProcessError: If check=True and command fails
     """
-    ssh_cmd = [
-        "ssh",
-        *ssh_identity_args(),
-        "-o", "StrictHostKeyChecking=no",
-        "-o", "UserKnownHostsFile=/dev/null",
-        "-o", f"ConnectTimeout={constants.SSH_CONNECT_TIMEOUT}",
-        f"{user}@{host}",
-        command
-    ]
+    ssh_cmd = _ssh_argv(host, user, command, connect_timeout, multiplex=True)
 
     if stream_output or DebugContext.is_debug():
         print(f"🔧 Executing on {user}@{host}: {command}")
         proc = subprocess.Popen(
             ssh_cmd,
+            stdin=subprocess.PIPE if input_text is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
         )
-        assert proc.stdout is not None
-        output_lines = []
-        for line in proc.stdout:
-            print(line, end="")
-            output_lines.append(line)
+        if input_text is not None:
+            proc.stdin.write(input_text.encode())
+            proc.stdin.close()
+        output = _drain_output(proc, echo=True)
         rc = proc.wait()
 
         result = subprocess.CompletedProcess(
             ssh_cmd,
             rc,
-            stdout=''.join(output_lines),
+            stdout=output,
             stderr=None
         )
 
@@ -462,6 +648,7 @@ def ssh_command(
     else:
         result = subprocess.run(
             ssh_cmd,
+            input=input_text,
             capture_output=True,
             text=True,
             check=check
@@ -469,6 +656,212 @@ def ssh_command(
         return result
 
 
+def ssh_command_many(
+    host: str,
+    user: str,
+    commands: list[str],
+    check: bool = True,
+    connect_timeout: Optional[int] = None
+) -> list[subprocess.CompletedProcess]:
+    """
+    Run several commands over one SSH session, returning one result per command.
+
+    Each command runs in its own subshell, so `cd`/`exit` behave as they
+    would in separate ssh_command() calls, but only one connection and
+    one remote shell are set up. Exit codes and per-command output are
+    recovered from marker lines written after each command.
+
+    Args:
+        host: Target hostname or IP address
+        user: SSH username
+        commands: Commands to run, in order
+        check: If True, stop at the first failing command and raise for it
+        connect_timeout: SSH connect timeout in seconds (defaults to constants.SSH_CONNECT_TIMEOUT)
+
+    Returns:
+        List of CompletedProcess, one per command (with check=False, commands
+        not reached because the session died carry the ssh exit code)
+
+    Raises:
+        subprocess.CalledProcessError: If check=True and a command (or the session) fails
+    """
+    if not commands:
+        return []
+
+    marker = f"__paas_rc_{os.urandom(8).hex()}"
+    steps = []
+    for command in commands:
+        steps.append(f"( {command}\n); rc=$?; printf '\\n{marker} %d\\n' \"$rc\"; printf '\\n{marker} %d\\n' \"$rc\" >&2")
+        if check:
+            steps.append('[ "$rc" -eq 0 ] || exit "$rc"')
+    script = "\n".join(steps)
+    # The client's own warnings ("Permanently added ...") would otherwise
+    # precede the first marker and land in the first command's stderr
+    ssh_cmd = _ssh_argv(host, user, script, connect_timeout, multiplex=True)
+    ssh_cmd[1:1] = ["-o", "LogLevel=ERROR"]
+
+    if DebugContext.is_debug():
+        print(f"🔧 Executing {len(commands)} command(s) on {user}@{host}: {'; '.join(commands)}")
+    proc = subprocess.run(ssh_cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+
+    split = re.compile(rf"\n{marker} (\d+)\n")
+    out_parts = split.split(proc.stdout)
+    err_parts = split.split(proc.stderr)
+    results: list[subprocess.CompletedProcess] = []
+    for i, command in enumerate(commands):
+        if 2 * i + 1 >= len(out_parts):
+            break
+        rc = int(out_parts[2 * i + 1])
+        stderr = err_parts[2 * i] if 2 * i + 1 < len(err_parts) else ""
+        result = subprocess.CompletedProcess(command, rc, stdout=out_parts[2 * i], stderr=stderr)
+        if rc != 0 and check:
+            raise subprocess.CalledProcessError(rc, command, result.stdout, result.stderr)
+        results.append(result)
+
+    if len(results) < len(commands):
+        # The session ended before every command reported back
+        if check:
+            raise subprocess.CalledProcessError(proc.returncode, ssh_cmd, proc.stdout, proc.stderr)
+        rc = proc.returncode or 255
+        results += [
+            subprocess.CompletedProcess(command, rc, stdout="", stderr=err_parts[-1])
+            for command in commands[len(results):]
+        ]
+
+    return results
+
+
+async def ssh_command_async(
+    host: str,
+    user: str,
+    command: str,
+    check: bool = True,
+    connect_timeout: Optional[int] = None
+) -> subprocess.CompletedProcess:
+    """
+    Execute a command on a remote host via SSH without blocking the event loop.
+
+    Output is always captured; use ssh_command() for streamed output.
+
+    Args:
+        host: Target hostname or IP address
+        user: SSH username
+        command: Command to execute on remote host
+        check: If True, raise exception on non-zero exit code
+        connect_timeout: SSH connect timeout in seconds (defaults to constants.SSH_CONNECT_TIMEOUT)
+
+    Returns:
+        CompletedProcess instance with command results
+
+    Raises:
+        subprocess.CalledProcessError: If check=True and command fails
+    """
+    ssh_cmd = _ssh_argv(host, user, command, connect_timeout, multiplex=True)
+    proc = await asyncio.create_subprocess_exec(
+        *ssh_cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    result = subprocess.CompletedProcess(
+        ssh_cmd,
+        proc.returncode,
+        stdout=stdout.decode(errors="replace"),
+        stderr=stderr.decode(errors="replace")
+    )
+
+    if result.returncode != 0 and check:
+        raise subprocess.CalledProcessError(result.returncode, ssh_cmd, result.stdout, result.stderr)
+
+    return result
+
+
+def ssh_tar_upload(
+    host: str,
+    user: str,
+    source_dir: Path,
+    remote_dir: str,
+    replace: bool = True
+) -> None:
+    """
+    Upload the contents of a local directory as one tar stream over SSH.
+
+    One connection replaces the scp walk (a round trip per file) plus the
+    separate ssh calls otherwise needed to clean/rename the destination.
+    The connection is multiplexed, so follow-up commands to the same host
+    reuse it without a new handshake.
+
+    Args:
+        host: Target hostname or IP address
+        user: SSH username
+        source_dir: Local directory whose contents are uploaded
+        remote_dir: Remote destination directory (expanded by the remote shell, so ~ works)
+        replace: If True, remove remote_dir before extracting
+
+    Raises:
+        subprocess.CalledProcessError: If packing or the remote extract fails
+    """
+    steps = ["set -e"]
+    if replace:
+        steps.append(f"rm -rf {remote_dir}")
+    steps += [f"mkdir -p {remote_dir}", f"tar -xf - -C {remote_dir}"]
+    ssh_cmd = _ssh_argv(host, user, "; ".join(steps), multiplex=True)
+
+    print(f"📤 Streaming {source_dir} to {user}@{host}:{remote_dir}")
+
+    packer = subprocess.Popen(
+        ["tar", "-cf", "-", "-C", str(source_dir), "."],
+        stdout=subprocess.PIPE,
+    )
+    assert packer.stdout is not None
+    try:
+        result = subprocess.run(
+            ssh_cmd,
+            stdin=packer.stdout,
+            capture_output=True,
+            text=True,
+        )
+    finally:
+        packer.stdout.close()
+    pack_rc = packer.wait()
+
+    if pack_rc != 0:
+        print(f"❌ Upload failed: tar exited with code {pack_rc}")
+        raise subprocess.CalledProcessError(pack_rc, packer.args)
+    if result.returncode != 0:
+        print(f"❌ Upload failed: {result.stderr}")
+        raise subprocess.CalledProcessError(result.returncode, ssh_cmd, result.stdout, result.stderr)
+
+    print(f"✅ Upload completed successfully")
+
+
+_SCP_ERROR_TAIL_LINES = 64
+
+
+def _run_scp(scp_cmd: list[str]) -> tuple[int, str]:
+    """
+    Run scp without buffering its whole output.
+
+    stdout is discarded and only the last _SCP_ERROR_TAIL_LINES lines of
+    stderr are kept, which is all a failure report needs.
+
+    Returns:
+        Tuple of (exit code, stderr tail)
+    """
+    proc = subprocess.Popen(
+        scp_cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    assert proc.stderr is not None
+    with proc.stderr:
+        tail = collections.deque(proc.stderr, maxlen=_SCP_ERROR_TAIL_LINES)
+    return proc.wait(), "".join(tail)
+
+
 def scp_upload(
     host: str,
     user: str,
@@ -489,12 +882,7 @@ def scp_upload(
     Raises:
         subprocess.CalledProcessError: If SCP fails
     """
-    scp_cmd = [
-        "scp",
-        *ssh_identity_args(),
-        "-o", "StrictHostKeyChecking=no",
-        "-o", "UserKnownHostsFile=/dev/null",
-    ]
+    scp_cmd = ["scp", *scp_base_args()]
 
     if recursive:
         scp_cmd.append("-r")
@@ -506,18 +894,13 @@ def scp_upload(
 
     print(f"📤 Uploading {source_path} to {user}@{host}:{dest_path}")
 
-    result = subprocess.run(
-        scp_cmd,
-        capture_output=True,
-        text=True,
-        check=True
-    )
+    rc, stderr_tail = _run_scp(scp_cmd)
 
-    if result.returncode == 0:
+    if rc == 0:
         print(f"✅ Upload completed successfully")
     else:
-        print(f"❌ Upload failed: {result.stderr}")
-        raise subprocess.CalledProcessError(result.returncode, scp_cmd, result.stdout, result.stderr)
+        print(f"❌ Upload failed: {stderr_tail}")
+        raise subprocess.CalledProcessError(rc, scp_cmd, None, stderr_tail)
 
 
 def scp_download(
@@ -540,12 +923,7 @@ def scp_download(
     Raises:
         subprocess.CalledProcessError: If SCP fails
     """
-    scp_cmd = [
-        "scp",
-        *ssh_identity_args(),
-        "-o", "StrictHostKeyChecking=no",
-        "-o", "UserKnownHostsFile=/dev/null",
-    ]
+    scp_cmd = ["scp", *scp_base_args()]
 
     if recursive:
         scp_cmd.append("-r")
@@ -557,15 +935,10 @@ def scp_download(
 
     print(f"📥 Downloading {user}@{host}:{source_path} to {dest_path}")
 
-    result = subprocess.run(
-        scp_cmd,
-        capture_output=True,
-        text=True,
-        check=True
-    )
+    rc, stderr_tail = _run_scp(scp_cmd)
 
-    if result.returncode == 0:
+    if rc == 0:
         print(f"✅ Download completed successfully")
     else:
-        print(f"❌ Download failed: {result.stderr}")
-        raise subprocess.CalledProcessError(result.returncode, scp_cmd, result.stdout, result.stderr)
+        print(f"❌ Download failed: {stderr_tail}")
+        raise subprocess.CalledProcessError(rc, scp_cmd, None, stderr_tail)
@@ -1,9 +1,21 @@
 import argparse
+import functools
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from pathlib import Path
 
 
+# Placeholders in template.html, filled in one pass per output file
+_PLACEHOLDER_RE = re.compile(r"\{(title|theme|bg_color|text_color|mermaid_code)\}")
+# Greedy body so the match runs to the last fence, as the old line scan did
+_FENCED_RE_BYTES = re.compile(rb"^[ \t]*```[^\n]*\n(.*)^[ \t]*```", re.MULTILINE | re.DOTALL)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Wrap Mermaid markdown files into HTML.")
     parser.add_argument(
@@ -37,26 +49,16 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def extract_mermaid(content: str) -> str:
-    lines = content.splitlines()
-    start = None
-    end = None
-
-    for idx, line in enumerate(lines):
-        if line.strip().startswith("```"):
-            start = idx
-            break
-
-    if start is not None:
-        for idx in range(len(lines) - 1, start, -1):
-            if lines[idx].strip().startswith("```"):
-                end = idx
-                break
-
-        if end is not None and end > start:
-            return "\n".join(lines[start + 1 : end]).strip()
-
-    return "\n".join(lines).strip()
+def read_mermaid(md_path: Path) -> str:
+    # Everything between the first fence line and the last one after it;
+    # search the mapped file as bytes and decode only the fenced block
+    with open(md_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _FENCED_RE_BYTES.search(mm)
+            raw = match.group(1) if match else mm[:]
+    return raw.decode("utf-8").strip()
 
 
 def indent_mermaid(mermaid_code: str) -> str:
@@ -82,6 +84,11 @@ def theme_settings(use_dark: bool) -> dict:
     }
 
 
+def render_template(template: str, values: dict) -> str:
+    return _PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], template)
+
+
+@functools.lru_cache(maxsize=None)
 def load_template(template_path: Path) -> str:
     try:
         return template_path.read_text(encoding="utf-8")
@@ -89,6 +96,34 @@ def load_template(template_path: Path) -> str:
         sys.exit(f"Template not found: {template_path}")
 
 
+def write_html(output_file: Path, html: str) -> None:
+    # Encode once and hand the kernel a single large write
+    with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+        fh.write(html.encode("utf-8"))
+
+
+def process_markdown(
+    md_path: Path, template: str, theme: dict, output_dir: Path, name: Optional[str]
+) -> Path:
+    mermaid_raw = read_mermaid(md_path)
+    mermaid_block = indent_mermaid(mermaid_raw)
+
+    base_name = name if name else md_path.stem
+    title = base_name
+    output_file = output_dir / f"{base_name}{theme['suffix']}.html"
+
+    html = render_template(template, {
+        "title": title,
+        "theme": theme["theme"],
+        "bg_color": theme["bg_color"],
+        "text_color": theme["text_color"],
+        "mermaid_code": mermaid_block,
+    })
+
+    write_html(output_file, html)
+    return output_file
+
+
 def collect_targets(base_dir: Path, source_dir: Path, input_path: Optional[str]) -> List[Path]:
     if input_path:
         candidate = Path(input_path)
@@ -98,7 +133,13 @@ def collect_targets(base_dir: Path, source_dir: Path, input_path: Optional[str])
             sys.exit(f"Input file not found: {candidate}")
         return [candidate]
 
-    md_files = sorted(source_dir.glob("*.md"))
+    # scandir entries carry their type, so no Path/stat per candidate; skip dotfiles
+    with os.scandir(source_dir) as entries:
+        md_files = [
+            Path(entry.path)
+            for entry in sorted(entries, key=lambda e: e.name)
+            if entry.name.endswith(".md") and not entry.name.startswith(".") and entry.is_file()
+        ]
     if not md_files:
         print(f"No .md files found in {source_dir}")
     return md_files
@@ -135,29 +176,13 @@ def main() -> None:
 
     theme = theme_settings(args.dark)
 
-    for md_path in targets:
-        content = md_path.read_text(encoding="utf-8")
-        mermaid_raw = extract_mermaid(content)
-        mermaid_block = indent_mermaid(mermaid_raw)
-
-        base_name = args.name if args.name else md_path.stem
-        title = base_name
-        output_file = output_dir / f"{base_name}{theme['suffix']}.html"
-
-        replacements = {
-            "{title}": title,
-            "{theme}": theme["theme"],
-            "{bg_color}": theme["bg_color"],
-            "{text_color}": theme["text_color"],
-            "{mermaid_code}": mermaid_block,
-        }
-
-        html = template
-        for placeholder, value in replacements.items():
-            html = html.replace(placeholder, value)
+    def render_one(md_path: Path) -> Path:
+        return process_markdown(md_path, template, theme, output_dir, args.name)
 
-        output_file.write_text(html, encoding="utf-8")
-        print(f"Generated: {output_file}")
+    # Files are independent; threads overlap the reads and writes
+    with ThreadPoolExecutor(max_workers=min(len(targets), os.cpu_count() or 1)) as pool:
+        for output_file in pool.map(render_one, targets):
+            print(f"Generated: {output_file}")
 
 
 if __name__ == "__main__":
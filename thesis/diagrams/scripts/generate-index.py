@@ -2,97 +2,15 @@
 """Generate index.html for all diagram outputs"""
 
 import os
+import re
 import argparse
 from pathlib import Path
 
-def parse_args():
-    parser = argparse.ArgumentParser(description="Generate index.html for diagram outputs")
-    parser.add_argument(
-        "-o",
-        "--output-dir",
-        default="output",
-        help="Base output directory containing the html subdirectory.",
-    )
-    return parser.parse_args()
-
-def get_diagram_title(html_path, basename):
-    try:
-        with open(html_path, 'r', encoding='utf-8') as hf:
-            for line in hf:
-                if '<title>' in line:
-                    return line.split('<title>')[1].split('</title>')[0]
-    except Exception:
-        pass
-    return basename.replace('_', ' ').title()
-
-def generate_card(html_path, basename):
-    title = get_diagram_title(html_path, basename)
-    
-    if 'phase' in basename:
-        phase_parts = basename.split('_')
-        # Try to get phase number like "phase1"
-        phase = phase_parts[0]
-    elif 'summary' in basename:
-        phase = "Summary"
-    elif 'complete' in basename:
-        phase = "Complete Flow"
-    else:
-        phase = "Misc"
-
-    return f'''        <div class="card">
-            <div class="card-header">
-                <h2>{title}</h2>
-                <span class="badge">{phase}</span>
-            </div>
-            <div class="links">
-                <a href="html/{basename}.html" target="_blank">View Diagram</a>
-            </div>
-        </div>
-'''
-
-def main():
-    args = parse_args()
-    
-    # Handle relative paths
-    base_dir = Path.cwd()
-    output_dir = Path(args.output_dir)
-    if not output_dir.is_absolute():
-        output_dir = base_dir / output_dir
-
-    html_dir = output_dir / "html"
-
-    print("=== Generating Index ===\n")
-    print(f"Scanning for HTML files in: {html_dir}")
-
-    if not html_dir.exists():
-         print(f"ERROR: Directory not found: {html_dir}")
-         return
-
-    # Find all HTML files except index.html
-    html_files = sorted([f for f in html_dir.glob("*.html") if f.name != "index.html"])
-
-    if not html_files:
-        print("ERROR: No HTML files found")
-        return
-
-    # Split into categories
-    sequence_diagrams = []
-    infra_diagrams = []
-
-    for f in html_files:
-        if "_sequence" in f.name:
-            sequence_diagrams.append(f)
-        else:
-            infra_diagrams.append(f)
+# <title> lives in <head>, so only the start of each file is scanned
+TITLE_SCAN_BYTES = 4096
+_TITLE_RE = re.compile(rb"<title>([^<]*)</title>")
 
-    print(f"Found {len(infra_diagrams)} Infrastructure Diagrams")
-    print(f"Found {len(sequence_diagrams)} Sequence Diagrams\n")
-
-    # Generate index.html
-    index_file = output_dir / "index.html"
-
-    with open(index_file, 'w', encoding='utf-8') as f:
-        f.write('''<!DOCTYPE html>
+INDEX_HEADER = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -210,24 +128,18 @@ def main():
         <div class="column">
             <div class="column-header">Infrastructure & Process Diagrams</div>
             <div class="grid">
-''')
-
-        for html_path in infra_diagrams:
-            f.write(generate_card(html_path, html_path.stem))
+'''
 
-        f.write('''            </div>
+INDEX_MIDDLE = '''            </div>
         </div>
 
         <!-- Column 2: Sequence Diagrams -->
         <div class="column">
             <div class="column-header">Sequence Diagrams</div>
             <div class="grid">
-''')
-
-        for html_path in sequence_diagrams:
-            f.write(generate_card(html_path, html_path.stem))
+'''
 
-        f.write('''            </div>
+INDEX_FOOTER = '''            </div>
         </div>
     </div>
 
@@ -237,7 +149,109 @@ def main():
     </div>
 </body>
 </html>
-''')
+'''
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate index.html for diagram outputs")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default="output",
+        help="Base output directory containing the html subdirectory.",
+    )
+    return parser.parse_args()
+
+def get_diagram_title(html_path, basename):
+    try:
+        with open(html_path, 'rb') as hf:
+            match = _TITLE_RE.search(hf.read(TITLE_SCAN_BYTES))
+        if match:
+            return match.group(1).decode('utf-8')
+    except Exception:
+        pass
+    return basename.replace('_', ' ').title()
+
+def generate_card(html_path, basename):
+    title = get_diagram_title(html_path, basename)
+    
+    if 'phase' in basename:
+        phase_parts = basename.split('_')
+        # Try to get phase number like "phase1"
+        phase = phase_parts[0]
+    elif 'summary' in basename:
+        phase = "Summary"
+    elif 'complete' in basename:
+        phase = "Complete Flow"
+    else:
+        phase = "Misc"
+
+    return f'''        <div class="card">
+            <div class="card-header">
+                <h2>{title}</h2>
+                <span class="badge">{phase}</span>
+            </div>
+            <div class="links">
+                <a href="html/{basename}.html" target="_blank">View Diagram</a>
+            </div>
+        </div>
+'''
+
+def main():
+    args = parse_args()
+    
+    # Handle relative paths
+    base_dir = Path.cwd()
+    output_dir = Path(args.output_dir)
+    if not output_dir.is_absolute():
+        output_dir = base_dir / output_dir
+
+    html_dir = output_dir / "html"
+
+    print("=== Generating Index ===\n")
+    print(f"Scanning for HTML files in: {html_dir}")
+
+    if not html_dir.exists():
+         print(f"ERROR: Directory not found: {html_dir}")
+         return
+
+    # Find all HTML files except index.html
+    with os.scandir(html_dir) as entries:
+        html_files = [
+            Path(entry.path)
+            for entry in sorted(entries, key=lambda e: e.name)
+            if entry.name.endswith(".html")
+            and entry.name != "index.html"
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+    if not html_files:
+        print("ERROR: No HTML files found")
+        return
+
+    # Split into categories
+    sequence_diagrams = []
+    infra_diagrams = []
+
+    for f in html_files:
+        if "_sequence" in f.name:
+            sequence_diagrams.append(f)
+        else:
+            infra_diagrams.append(f)
+
+    print(f"Found {len(infra_diagrams)} Infrastructure Diagrams")
+    print(f"Found {len(sequence_diagrams)} Sequence Diagrams\n")
+
+    # Generate index.html
+    index_file = output_dir / "index.html"
+
+    parts: list[str] = [INDEX_HEADER]
+    parts.extend(generate_card(html_path, html_path.stem) for html_path in infra_diagrams)
+    parts.append(INDEX_MIDDLE)
+    parts.extend(generate_card(html_path, html_path.stem) for html_path in sequence_diagrams)
+    parts.append(INDEX_FOOTER)
+    # Assemble the page in memory and write it out in one go
+    index_file.write_bytes("".join(parts).encode('utf-8'))
 
     print(f"✓ Index generated: {index_file}")
     print(f"\nOpen file://{index_file} in your browser")
@@ -4,33 +4,85 @@ bump_submodules.py — Local-only Git orchestrator for submodule updates.
 Requires: Python 3.12+, PyYAML, GitPython, Pydantic v2
 
 Usage:
-  python tools/bump_submodules.py [--config submodules.yaml] [--dry-run] [--tag v1.0] [--auto-stash]
+  python tools/bump_submodules.py [--config submodules.yaml] [--dry-run] [--tag v1.0] [--auto-stash] [--jobs N]
+
+  In CI prefer `python -m tools.bump_submodules ...` from the repo root: a
+  module run reuses the cached bytecode in tools/__pycache__, while a script
+  path is recompiled from source on every invocation.
 """
 
 from __future__ import annotations
 import argparse
+import collections
+import functools
+import hashlib
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict
+
+# yaml, pydantic and git are imported where they are first needed so that
+# --help and argument errors don't pay for them
+if TYPE_CHECKING:
+    from git import Repo
+    from pydantic import BaseModel
+
+    # Mirrors of the models built by config_models(), for annotations only
+    class ModuleConfig(BaseModel):
+        name: str
+        url: str
+        branch: str
+
+    class SubmoduleConfig(BaseModel):
+        modules: List[ModuleConfig]
+
+# Submodules are bumped concurrently; fetches are network-bound git subprocesses
+MAX_BUMP_WORKERS = 8
+
+# Lines of command output kept for error reports
+RUN_OUTPUT_TAIL_LINES = 64
+
+# A `branch:` that is a full commit id pins the submodule to that commit
+_FULL_SHA_RE = re.compile(r"[0-9a-f]{40}")
 
-import yaml
-from pydantic import BaseModel, Field
-from git import Repo, GitCommandError, InvalidGitRepositoryError
+# Digest of .gitmodules + configured modules from the last successful init,
+# kept in the superproject's git dir
+INIT_DIGEST_FILE = "bump_submodules_last.digest"
+
+# Index entry mode of a submodule pointer
+GITLINK_MODE = 0o160000
 
 
 # ---------------------------
 # Models
 # ---------------------------
 
-class ModuleConfig(BaseModel):
-    name: str
-    url: str
-    branch: str
+@functools.lru_cache(maxsize=None)
+def config_models() -> tuple[type, type]:
+    """Define and return (ModuleConfig, SubmoduleConfig) on first use."""
+    from pydantic import BaseModel, Field
+
+    class ModuleConfig(BaseModel):
+        name: str
+        url: str
+        branch: str
+
+    class SubmoduleConfig(BaseModel):
+        modules: List[ModuleConfig] = Field(..., description="List of submodules")
 
+    return ModuleConfig, SubmoduleConfig
 
-class SubmoduleConfig(BaseModel):
-    modules: List[ModuleConfig] = Field(..., description="List of submodules")
+
+def __getattr__(name: str):
+    # Keep `bump_submodules.ModuleConfig` / `.SubmoduleConfig` importable
+    if name == "ModuleConfig":
+        return config_models()[0]
+    if name == "SubmoduleConfig":
+        return config_models()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------
@@ -38,36 +90,160 @@ class SubmoduleConfig(BaseModel):
 # ---------------------------
 
 def run(cmd: List[str], cwd: Optional[Path] = None) -> str:
-    """Run a local command (mainly git) and return stdout, raise on error."""
-    res = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-    if res.returncode != 0:
-        raise RuntimeError(
-            f"Command failed ({' '.join(cmd)}):\nSTDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
-        )
-    return res.stdout.strip()
+    """
+    Run a local command (mainly git), raise on error.
+
+    Output (stdout and stderr combined) is consumed as it is produced and
+    only the last RUN_OUTPUT_TAIL_LINES lines are kept; they are returned
+    stripped and used in the error message.
+    """
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    assert proc.stdout is not None
+    with proc.stdout:
+        tail = collections.deque(proc.stdout, maxlen=RUN_OUTPUT_TAIL_LINES)
+    output = "".join(tail).strip()
+    if proc.wait() != 0:
+        raise RuntimeError(f"Command failed ({' '.join(cmd)}):\nOUTPUT:\n{output}")
+    return output
+
+
+@functools.lru_cache(maxsize=None)
+def get_repo(path: Path) -> Repo:
+    """
+    Open a repository once per path for the whole run.
+
+    GitPython reads config and sets up its git wrapper (and a persistent
+    cat-file process) per Repo, so helpers share one instance per submodule.
+    """
+    from git import Repo
+
+    return Repo(path)
+
+
+@functools.lru_cache(maxsize=None)
+def module_path(name: str) -> Path:
+    # One Path per configured module, shared by every helper
+    return Path(name)
+
+
+@functools.lru_cache(maxsize=None)
+def dir_entries(parent: str) -> frozenset[str]:
+    """Names in `parent`, from one scandir per directory for the whole run."""
+    try:
+        with os.scandir(parent) as it:
+            return frozenset(e.name for e in it)
+    except FileNotFoundError:
+        return frozenset()
+
+
+def module_exists(name: str) -> bool:
+    """Whether a submodule path exists, answered from the cached parent listing."""
+    parent, _, base = name.rstrip("/").rpartition("/")
+    return base in dir_entries(parent or ".")
 
 
 def ensure_superproject(path: Path) -> Repo:
+    from git import InvalidGitRepositoryError
+
     try:
-        return Repo(path)
+        return get_repo(path)
     except InvalidGitRepositoryError as e:
         raise SystemExit(f"❌ Not a git repo: {path}") from e
 
 
+def is_dirty(
+    repo: Repo, untracked_files: bool = False, ignore_submodules: Optional[str] = None
+) -> bool:
+    """
+    Worktree/index dirtiness from a single `git status --porcelain`.
+
+    GitPython's Repo.is_dirty runs `git diff --cached`, `git diff` and, for
+    untracked files, `git status` as separate processes.
+    `ignore_submodules` is passed through as --ignore-submodules=<when>;
+    "dirty" skips scanning submodule worktrees but still reports moved
+    submodule pointers, "all" ignores submodules entirely.
+    """
+    untracked = "normal" if untracked_files else "no"
+    args = ["--porcelain", f"--untracked-files={untracked}"]
+    if ignore_submodules:
+        args.append(f"--ignore-submodules={ignore_submodules}")
+    # The untracked cache lets repeat scans skip unchanged directories; it
+    # is enabled for this call only, the repo's config is not touched
+    return bool(repo.git(c="core.untrackedCache=true").status(*args))
+
+
 def ensure_clean_superproject(repo: Repo, allow_dirty: bool = False) -> None:
     # superproject dirtiness does not include submodules; check separately
-    if repo.is_dirty(untracked_files=True) and not allow_dirty:
+    if is_dirty(repo, untracked_files=True, ignore_submodules="dirty") and not allow_dirty:
         raise SystemExit("❌ Superproject has uncommitted changes. Commit/stash first.")
 
 
-def ensure_submodules_initialized() -> None:
+def submodules_digest(root: Repo, conf: SubmoduleConfig) -> Optional[str]:
+    """
+    Fingerprint of what `ensure_submodules_initialized` acts on.
+
+    Covers the .gitmodules contents, the configured module names and the
+    submodule commits recorded in the superproject index (gitlinks), so an
+    edited .gitmodules or config, or a pull that moves submodule pointers,
+    changes the digest. None when there is no .gitmodules to fingerprint.
+    """
+    try:
+        gitmodules = Path(".gitmodules").read_bytes()
+    except FileNotFoundError:
+        return None
+    h = hashlib.blake2b(gitmodules)
+    for mod in conf.modules:
+        h.update(b"\0" + mod.name.encode())
+    # Gitlinks straight from the index file, no `git ls-files` process
+    gitlinks = sorted(
+        (path, entry.binsha)
+        for (path, _), entry in root.index.entries.items()
+        if entry.mode == GITLINK_MODE
+    )
+    for path, binsha in gitlinks:
+        h.update(b"\0" + path.encode() + b"\0" + binsha)
+    return h.hexdigest()
+
+
+def ensure_submodules_initialized(root: Repo, conf: SubmoduleConfig, jobs: int = 0) -> None:
+    """
+    Sync and init/update the submodules unless the last run already did.
+
+    Skipped when no modules are configured, or when the digest recorded by
+    the last successful run still matches and every module has a checkout.
+    """
+    if not conf.modules:
+        return
+    digest = submodules_digest(root, conf)
+    digest_file = Path(root.git_dir) / INIT_DIGEST_FILE
+    try:
+        last = digest_file.read_text().strip()
+    except FileNotFoundError:
+        last = None
+    # A deinit'ed or deleted submodule has no .git entry; re-init then
+    if digest and digest == last and all((module_path(mod.name) / ".git").exists() for mod in conf.modules):
+        print("✅ Submodules already initialized (.gitmodules and pointers unchanged)")
+        return
+
     # sync URLs from .gitmodules, then init/update recursively
     run(["git", "submodule", "sync", "--recursive"])
-    # depth=1 keeps it fast; remove if you prefer full history
-    run(["git", "submodule", "update", "--init", "--recursive", "--depth", "1"])
+    # depth=1 keeps it fast; remove if you prefer full history.
+    # --jobs clones/fetches submodules in parallel (0 lets git pick).
+    run([
+        "git", "submodule", "update", "--init", "--recursive",
+        "--depth", "1", "--single-branch", "--jobs", str(jobs),
+    ])
+    # update --init may have created submodule directories
+    dir_entries.cache_clear()
+    if digest:
+        digest_file.write_text(digest + "\n")
 
 
 def fetch_remote(sub_repo: Repo, remote: str, branch: str) -> None:
+    from git import GitCommandError
+
     try:
         sub_repo.git.fetch(remote, branch)
     except GitCommandError as e:
@@ -76,27 +252,88 @@ def fetch_remote(sub_repo: Repo, remote: str, branch: str) -> None:
         ) from e
 
 
+def ref_sha(repo: Repo, ref_path: str) -> Optional[str]:
+    """
+    Resolve a ref (e.g. HEAD, refs/heads/main) to its hexsha, or None if missing.
+
+    Reads loose/packed ref files in-process instead of forking `git rev-parse`.
+    """
+    from git import SymbolicReference
+
+    try:
+        return SymbolicReference.dereference_recursive(repo, ref_path)
+    except ValueError:
+        return None
+
+
+def remote_tip(sub_repo: Repo, remote: str, branch: str) -> Optional[str]:
+    """Branch tip as advertised by the remote (ls-remote: no pack negotiation), or None."""
+    from git import GitCommandError
+
+    try:
+        out = sub_repo.git.ls_remote("--heads", remote, f"refs/heads/{branch}")
+    except GitCommandError:
+        return None
+    sha, _, _ = out.partition("\t")
+    return sha or None
+
+
+def fetch_if_moved(sub_repo: Repo, remote: str, branch: str) -> None:
+    """Fetch only when the remote tip differs from our remote-tracking ref."""
+    cached = ref_sha(sub_repo, f"refs/remotes/{remote}/{branch}")
+    if cached is not None and remote_tip(sub_repo, remote, branch) == cached:
+        return
+    fetch_remote(sub_repo, remote, branch)
+
+
 def current_sha(sub_repo: Repo) -> str:
-    return sub_repo.head.commit.hexsha
+    sha = ref_sha(sub_repo, "HEAD")
+    if sha is None:
+        raise SystemExit(f"❌ HEAD does not resolve in {sub_repo.working_dir}")
+    return sha
 
 
 def remote_sha(sub_repo: Repo, remote: str, branch: str) -> str:
-    return sub_repo.git.rev_parse(f"{remote}/{branch}")
+    sha = ref_sha(sub_repo, f"refs/remotes/{remote}/{branch}")
+    if sha is None:
+        raise SystemExit(f"❌ {remote}/{branch} not found in {sub_repo.working_dir}")
+    return sha
 
 
-def checkout_tracking_branch(sub_repo: Repo, branch: str, remote: str = "origin") -> None:
+def on_branch(repo: Repo, branch: str) -> bool:
+    """True if HEAD is attached to refs/heads/<branch> (read from HEAD, no fork)."""
+    head = repo.head
+    return not head.is_detached and head.reference.path == f"refs/heads/{branch}"
+
+
+def has_commit(repo: Repo, sha: str) -> bool:
+    """True if the object is already in the local object database."""
     try:
-        # If branch exists locally, switch to it
+        repo.odb.info(bytes.fromhex(sha))
+        return True
+    except ValueError:
+        return False
+
+
+def checkout_tracking_branch(sub_repo: Repo, branch: str, remote: str = "origin") -> None:
+    if on_branch(sub_repo, branch):
+        # Already there; nothing for git checkout to do
+        return
+    if ref_sha(sub_repo, f"refs/heads/{branch}") is not None:
+        # Branch exists locally, switch to it
         sub_repo.git.checkout(branch)
-    except GitCommandError:
+    else:
         # Create it to track remote tip
         sub_repo.git.checkout("-B", branch, f"{remote}/{branch}")
 
 
 def ff_to_remote(sub_repo: Repo, branch: str, remote: str = "origin") -> None:
+    from git import GitCommandError
+
     try:
-        # Enforce fast-forward only
-        sub_repo.git.merge(f"{remote}/{branch}", ff_only=True)
+        # Enforce fast-forward only; --no-stat skips the diffstat git would
+        # otherwise compute over the whole range just for us to discard it
+        sub_repo.git.merge(f"{remote}/{branch}", ff_only=True, no_stat=True)
     except GitCommandError as e:
         raise SystemExit(
             f"❌ Fast-forward failed in {sub_repo.working_dir}. "
@@ -106,11 +343,22 @@ def ff_to_remote(sub_repo: Repo, branch: str, remote: str = "origin") -> None:
 
 def check_branch_exists(repo: Repo, branch_name: str) -> bool:
     """Check if a branch exists locally in the repository."""
-    try:
-        repo.git.rev_parse("--verify", branch_name)
-        return True
-    except GitCommandError:
-        return False
+    return ref_sha(repo, f"refs/heads/{branch_name}") is not None
+
+
+def switch_to_new_branch(repo: Repo, branch_name: str) -> None:
+    """
+    Equivalent of `git checkout -b <branch>` without forking git.
+
+    The new branch starts at HEAD, so only the ref file and HEAD's symref
+    change; index and worktree are already correct.
+    """
+    head = repo.head
+    previous = head.commit.hexsha if head.is_detached else head.reference.name
+    head.set_reference(
+        repo.create_head(branch_name),
+        logmsg=f"checkout: moving from {previous} to {branch_name}",
+    )
 
 
 def create_new_branch_all_repos(conf: SubmoduleConfig, root: Repo, branch_name: str) -> None:
@@ -118,6 +366,8 @@ def create_new_branch_all_repos(conf: SubmoduleConfig, root: Repo, branch_name:
     Create a new branch in the superproject and all submodules.
     First checks if the branch exists anywhere; if so, exits with error.
     Only creates the branch if it doesn't exist in any repo.
+    Both passes are in-process ref reads/writes (no git subprocesses); they
+    stay separate so a clash in any repo leaves every repo untouched.
     """
     print(f"🔍 Checking if branch '{branch_name}' exists in any repo...")
     
@@ -126,13 +376,14 @@ def create_new_branch_all_repos(conf: SubmoduleConfig, root: Repo, branch_name:
         raise SystemExit(f"❌ Branch '{branch_name}' already exists in superproject. Aborting.")
     print(f"✅ Superproject: branch '{branch_name}' does not exist")
     
-    # Check all submodules
+    # Check all submodules, keeping the opened repos for the create pass
+    sub_repos: List[tuple[str, Repo]] = []
     for mod in conf.modules:
-        sub_path = Path(mod.name)
-        if not sub_path.exists():
+        if not module_exists(mod.name):
             raise SystemExit(f"❌ Submodule path not found: {mod.name}")
         
-        sub_repo = Repo(sub_path)
+        sub_repo = get_repo(module_path(mod.name))
+        sub_repos.append((mod.name, sub_repo))
         if check_branch_exists(sub_repo, branch_name):
             raise SystemExit(f"❌ Branch '{branch_name}' already exists in submodule '{mod.name}'. Aborting.")
         print(f"✅ {mod.name}: branch '{branch_name}' does not exist")
@@ -140,52 +391,68 @@ def create_new_branch_all_repos(conf: SubmoduleConfig, root: Repo, branch_name:
     print(f"\n🌿 Creating branch '{branch_name}' in all repos...")
     
     # Create and checkout branch in superproject
-    root.git.checkout("-b", branch_name)
+    switch_to_new_branch(root, branch_name)
     print(f"✅ Superproject: created and checked out branch '{branch_name}'")
     
     # Create and checkout branch in all submodules
-    for mod in conf.modules:
-        sub_path = Path(mod.name)
-        sub_repo = Repo(sub_path)
-        sub_repo.git.checkout("-b", branch_name)
-        print(f"✅ {mod.name}: created and checked out branch '{branch_name}'")
+    for name, sub_repo in sub_repos:
+        switch_to_new_branch(sub_repo, branch_name)
+        print(f"✅ {name}: created and checked out branch '{branch_name}'")
     
     print(f"\n🎉 Successfully created and checked out branch '{branch_name}' in all repos!")
 
 
-def commit_all_repos(conf: SubmoduleConfig, root: Repo, commit_message: str) -> None:
+def commit_tracked_changes(
+    repo: Repo, commit_message: str, ignore_submodules: Optional[str] = None
+) -> bool:
+    """Stage modified/deleted tracked files and commit them; False if there was nothing to commit."""
+    if not is_dirty(repo, untracked_files=False, ignore_submodules=ignore_submodules):
+        return False
+    repo.git.add("-u")  # Stage all modified/deleted tracked files
+    repo.index.commit(commit_message)
+    return True
+
+
+def commit_all_repos(
+    conf: SubmoduleConfig, root: Repo, commit_message: str, jobs: int = MAX_BUMP_WORKERS
+) -> None:
     """
     Commit uncommitted versioned (tracked) files in the superproject and all submodules.
     Only commits files that are already tracked by git (modified or deleted), not untracked files.
+    Submodules are independent repos, so they are committed concurrently (up to `jobs`).
     """
     print(f"📝 Committing changes in all repos with message: '{commit_message}'")
     
     committed_count = 0
     
     # Commit superproject
-    if root.is_dirty(untracked_files=False):
-        root.git.add("-u")  # Stage all modified/deleted tracked files
-        root.index.commit(commit_message)
+    if commit_tracked_changes(root, commit_message, ignore_submodules="dirty"):
         print(f"✅ Superproject: committed changes")
         committed_count += 1
     else:
         print(f"ℹ️  Superproject: no changes to commit")
     
     # Commit all submodules
+    sub_repos: List[tuple[str, Optional[Repo]]] = []
     for mod in conf.modules:
-        sub_path = Path(mod.name)
-        if not sub_path.exists():
-            print(f"⚠️  {mod.name}: submodule path not found, skipping")
-            continue
-        
-        sub_repo = Repo(sub_path)
-        if sub_repo.is_dirty(untracked_files=False):
-            sub_repo.git.add("-u")  # Stage all modified/deleted tracked files
-            sub_repo.index.commit(commit_message)
-            print(f"✅ {mod.name}: committed changes")
-            committed_count += 1
-        else:
-            print(f"ℹ️  {mod.name}: no changes to commit")
+        exists = module_exists(mod.name)
+        sub_repos.append((mod.name, get_repo(module_path(mod.name)) if exists else None))
+
+    workers = max(1, min(jobs, len(sub_repos)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [
+            ex.submit(commit_tracked_changes, sub_repo, commit_message) if sub_repo else None
+            for _, sub_repo in sub_repos
+        ]
+        # Report in config order, whatever order the commits finish in
+        for (name, _), fut in zip(sub_repos, futures):
+            if fut is None:
+                print(f"⚠️  {name}: submodule path not found, skipping")
+            elif fut.result():
+                print(f"✅ {name}: committed changes")
+                committed_count += 1
+            else:
+                print(f"ℹ️  {name}: no changes to commit")
     
     if committed_count > 0:
         print(f"\n🎉 Successfully committed changes in {committed_count} repo(s)!")
@@ -197,43 +464,92 @@ def commit_all_repos(conf: SubmoduleConfig, root: Repo, commit_message: str) ->
 # Main bump logic
 # ---------------------------
 
-def bump_submodule(mod: ModuleConfig, dry_run: bool = False) -> tuple[str, str, bool]:
+def bump_submodule(
+    mod: ModuleConfig, dry_run: bool = False, log: Callable[[str], None] = print
+) -> tuple[str, str, bool]:
     """
     Return (name, new_sha, changed?)
+
+    Progress goes through `log` so parallel callers can buffer it per module.
     """
-    sub_path = Path(mod.name)
-    if not sub_path.exists():
+    if not module_exists(mod.name):
         raise SystemExit(f"❌ Submodule path not found: {mod.name}")
 
-    print(f"\n📦 {mod.name} @ {mod.branch}")
+    log(f"\n📦 {mod.name} @ {mod.branch}")
 
-    sub_repo = Repo(sub_path)
+    sub_repo = get_repo(module_path(mod.name))
 
-    # Guard: submodule must be clean
-    if sub_repo.is_dirty(untracked_files=True):
+    # Guard: submodule must be clean (its own nested submodules don't matter here)
+    if is_dirty(sub_repo, untracked_files=True, ignore_submodules="all"):
         raise SystemExit(f"❌ {mod.name} has uncommitted changes. Commit/stash first.")
 
+    # Pinned to a commit: nothing to resolve, and fetch only if it's missing
+    if _FULL_SHA_RE.fullmatch(mod.branch):
+        local = current_sha(sub_repo)
+        target = mod.branch
+        if local == target:
+            log(f"✅ Pinned at {local[:8]}")
+            return (mod.name, local, False)
+        if dry_run:
+            log(f"🟡 [DRY-RUN] {local[:8]} → {target[:8]} (pinned)")
+            return (mod.name, target, True)
+        if not has_commit(sub_repo, target):
+            fetch_remote(sub_repo, "origin", target)
+        sub_repo.git.checkout("--detach", target)
+        log(f"✅ Pinned to {target[:8]}")
+        return (mod.name, target, True)
+
     # Ensure we’re on the right branch and up-to-date with remote
-    fetch_remote(sub_repo, "origin", mod.branch)
+    fetch_if_moved(sub_repo, "origin", mod.branch)
     checkout_tracking_branch(sub_repo, mod.branch, "origin")
 
     local = current_sha(sub_repo)
     remote = remote_sha(sub_repo, "origin", mod.branch)
 
     if local == remote:
-        print(f"✅ Up to date ({local[:8]})")
+        log(f"✅ Up to date ({local[:8]})")
         return (mod.name, local, False)
 
     if dry_run:
-        print(f"🟡 [DRY-RUN] {local[:8]} → {remote[:8]}")
+        log(f"🟡 [DRY-RUN] {local[:8]} → {remote[:8]}")
         return (mod.name, remote, True)
 
     ff_to_remote(sub_repo, mod.branch, "origin")
     new_sha = current_sha(sub_repo)
-    print(f"✅ Updated to {new_sha[:8]}")
+    log(f"✅ Updated to {new_sha[:8]}")
     return (mod.name, new_sha, True)
 
 
+def stage_submodule_pointers(root: Repo, conf: SubmoduleConfig) -> None:
+    """
+    Record every submodule's current HEAD as its gitlink in the superproject index.
+
+    Same result as `git add .gitmodules <submodules...>`, but the HEADs are
+    read in-process and written as --cacheinfo entries in one update-index
+    call, so git neither matches pathspecs nor scans submodule worktrees.
+    """
+    args: List[str] = []
+    for mod in conf.modules:
+        args += ["--cacheinfo", f"{GITLINK_MODE:o},{current_sha(get_repo(module_path(mod.name)))},{mod.name}"]
+    root.git.update_index(*args, "--", ".gitmodules")
+
+
+def bump_submodule_buffered(
+    mod: ModuleConfig, dry_run: bool = False
+) -> tuple[List[str], tuple[str, str, bool] | BaseException]:
+    """
+    Run bump_submodule in a worker, returning (log_lines, result or raised error).
+
+    Output is held back so the caller can print each module's block intact
+    and in config order, whatever order the workers finish in.
+    """
+    lines: List[str] = []
+    try:
+        return lines, bump_submodule(mod, dry_run=dry_run, log=lines.append)
+    except BaseException as e:  # SystemExit from the git guards included
+        return lines, e
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(description="Automate submodule updates (local-only).")
     ap.add_argument("--config", default="submodules.yaml", help="Path to YAML config.")
@@ -242,41 +558,79 @@ def main() -> None:
     ap.add_argument("--auto-stash", action="store_true", help="Stash parent before running and restore after.")
     ap.add_argument("--new_branch", help="Create and checkout a new branch in all repos (superproject + submodules).")
     ap.add_argument("--commit", help="Commit uncommitted versioned files in all repos with the provided message.")
+    ap.add_argument("-j", "--jobs", type=int, default=MAX_BUMP_WORKERS,
+                    help=f"Submodules to clone/bump concurrently (default: {MAX_BUMP_WORKERS}).")
     args = ap.parse_args()
 
     config_path = Path(args.config)
-    if not config_path.exists():
+    # One open+read; a missing file is reported the same as before
+    try:
+        config_bytes = config_path.read_bytes()
+    except FileNotFoundError:
         raise SystemExit(f"❌ Config file not found: {config_path}")
 
-    conf = SubmoduleConfig(**yaml.safe_load(config_path.read_text()))
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it; same safe semantics
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _, SubmoduleConfig = config_models()
+    conf = SubmoduleConfig(**yaml.load(config_bytes, Loader=yaml_loader))
     root = ensure_superproject(Path.cwd())
 
     # Handle new branch creation
     if args.new_branch:
-        ensure_submodules_initialized()
+        ensure_submodules_initialized(root, conf, args.jobs)
         create_new_branch_all_repos(conf, root, args.new_branch)
         return
 
     # Handle commit all repos
     if args.commit:
-        commit_all_repos(conf, root, args.commit)
+        commit_all_repos(conf, root, args.commit, jobs=args.jobs)
         return
 
-    if args.auto_stash:
+    # Only stash when there is something to stash: a clean tree would make
+    # `stash push` a no-op and the later `stash pop` fail
+    stashed = args.auto_stash and is_dirty(root, untracked_files=True, ignore_submodules="dirty")
+    if stashed:
         # Note: we stash only the superproject index/worktree; submodules must be clean
         print("🧺 Auto-stash: parent repo")
         run(["git", "stash", "push", "-u", "-m", "pre-bump (parent)"])
 
     try:
         ensure_clean_superproject(root, allow_dirty=False)
-        ensure_submodules_initialized()
+        ensure_submodules_initialized(root, conf, args.jobs)
 
         # Process modules
         changes: Dict[str, str] = {}
-        for mod in conf.modules:
-            name, sha, changed = bump_submodule(mod, dry_run=args.dry_run)
-            if changed:
-                changes[name] = sha
+        workers = max(1, min(args.jobs, len(conf.modules)))
+        failure: Optional[BaseException] = None
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(bump_submodule_buffered, mod, args.dry_run) for mod in conf.modules]
+
+            def stop_on_failure(fut) -> None:
+                # Like the sequential loop, don't start further modules once
+                # one has failed; already running ones still finish
+                if not fut.cancelled() and isinstance(fut.result()[1], BaseException):
+                    for pending in futures:
+                        pending.cancel()
+
+            for fut in futures:
+                fut.add_done_callback(stop_on_failure)
+            # Flush in config order so logs and the commit message stay deterministic
+            for fut in futures:
+                if fut.cancelled():
+                    continue
+                lines, outcome = fut.result()
+                if lines:
+                    print("\n".join(lines))
+                if isinstance(outcome, BaseException):
+                    failure = failure or outcome
+                elif failure is None:
+                    name, sha, changed = outcome
+                    if changed:
+                        changes[name] = sha
+        if failure is not None:
+            raise failure
 
         if args.dry_run:
             print("\n💡 Dry run complete — no commits made.")
@@ -287,7 +641,7 @@ def main() -> None:
             return
 
         # Stage submodule pointers and commit
-        root.git.add(".gitmodules", *[m.name for m in conf.modules])
+        stage_submodule_pointers(root, conf)
         msg_lines = [ "chore(submodules): bump to latest", "" ]
         msg_lines += [ f"- {name}: {sha[:8]}" for name, sha in changes.items() ]
         commit_msg = "\n".join(msg_lines)
@@ -305,10 +659,9 @@ def main() -> None:
         print("🚀 Pushed superproject changes successfully.")
 
     finally:
-        if args.auto_stash:
-            print("🧺 Restoring parent stash (if any)")
-            run(["git", "stash", "pop"], cwd=Path.cwd())
-            # If no stash existed, this will error; you can wrap in try/except if desired
+        if stashed:
+            print("🧺 Restoring parent stash")
+            run(["git", "stash", "pop", "--quiet"], cwd=Path.cwd())
 
 
 if __name__ == "__main__":